@@ -1,5 +1,7 @@
 """Pytest fixtures for Acquire board game tests."""
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -282,6 +284,9 @@ def mock_websocket():
         async def send_json(self, data):
             self.sent_messages.append(data)
 
+        async def send_text(self, data):
+            self.sent_messages.append(json.loads(data))
+
         async def receive_json(self):
             # For testing, this would be controlled by test
             pass
@@ -309,6 +314,9 @@ def mock_websockets():
         async def send_json(self, data):
             self.sent_messages.append(data)
 
+        async def send_text(self, data):
+            self.sent_messages.append(json.loads(data))
+
         async def close(self, code=1000, reason=""):
             pass
 
@@ -2,10 +2,17 @@
 
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
-import uuid
+import itertools
+import os
+import time
 
+# Trade ids are a per-process prefix plus a monotonic counter, which is
+# unique for the lifetime of the server without hitting the OS entropy pool
+_ID_PREFIX = f"{os.getpid():x}-{int(time.time()):x}"
+_ID_COUNTER = itertools.count()
 
-@dataclass
+
+@dataclass(slots=True)
 class TradeOffer:
     """Represents a trade offer between two players.
 
@@ -33,7 +40,7 @@ class TradeOffer:
     def __post_init__(self):
         """Generate a unique trade_id if not provided."""
         if self.trade_id is None:
-            self.trade_id = str(uuid.uuid4())
+            self.trade_id = f"{_ID_PREFIX}-{next(_ID_COUNTER):x}"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert trade offer to dictionary representation."""
@@ -1,5 +1,6 @@
 """Board state and tile logic for Acquire."""
 
+import sys
 from enum import Enum
 from typing import Optional
 from dataclasses import dataclass
@@ -13,9 +14,15 @@ class TileState(Enum):
     IN_CHAIN = "in_chain"
 
 
-@dataclass
+# Enum members are singletons; hot paths compare these with ``is``
+_EMPTY = TileState.EMPTY
+_PLAYED = TileState.PLAYED
+_IN_CHAIN = TileState.IN_CHAIN
+
+
+@dataclass(frozen=True, slots=True)
 class Tile:
-    """Represents a single tile."""
+    """Represents a single tile (immutable and hashable)."""
 
     column: int  # 1-12
     row: str  # A-I
@@ -30,20 +37,23 @@ class Tile:
     def coords(self) -> tuple[int, str]:
         return (self.column, self.row)
 
-    def __hash__(self):
-        return hash(self.coords)
-
-    def __eq__(self, other):
-        if isinstance(other, Tile):
-            return self.coords == other.coords
-        return False
-
     def __str__(self):
-        return f"{self.column}{self.row}"
+        return _TILE_STR[(self.column, self.row)]
 
     def __repr__(self):
         return f"Tile({self.column}, '{self.row}')"
 
+    @staticmethod
+    def _unchecked(column: int, row: str) -> "Tile":
+        """Build a Tile from coordinates already known to be valid.
+
+        Skips __post_init__ validation; only for internal board code.
+        """
+        tile = object.__new__(Tile)
+        object.__setattr__(tile, "column", column)
+        object.__setattr__(tile, "row", row)
+        return tile
+
     @classmethod
     def from_string(cls, s: str) -> "Tile":
         """Parse tile from string like '1A' or '12I'."""
@@ -53,7 +63,13 @@ class Tile:
         return cls(column, row)
 
 
-@dataclass
+# Interned "5C"-style labels for all 108 tiles, built once at import
+_TILE_STR: dict[tuple[int, str], str] = {
+    (col, row): sys.intern(f"{col}{row}") for col in range(1, 13) for row in "ABCDEFGHI"
+}
+
+
+@dataclass(slots=True)
 class BoardCell:
     """Represents a cell on the board."""
 
@@ -61,142 +77,361 @@ class BoardCell:
     chain: Optional[str] = None  # Name of hotel chain if IN_CHAIN
 
 
+# Cell labels in flat-index order, for serialization
+_CELL_LABELS: tuple[str, ...] = tuple(_TILE_STR.values())
+
+# Every tile in flat-index (column-major) order; Tiles are immutable, so
+# these instances are shared by all boards
+_ALL_TILES: tuple[Tile, ...] = tuple(Tile._unchecked(*coords) for coords in _TILE_STR)
+
+# Row letter -> 0-based row index (avoids str.index on hot paths)
+_ROW_INDEX: dict[str, int] = {row: i for i, row in enumerate("ABCDEFGHI")}
+
+
+def _cell_index(column: int, row: str) -> int:
+    """Flat index of a cell in the board's column-major cell arrays."""
+    return (column - 1) * 9 + _ROW_INDEX[row]
+
+
+def _build_adjacency() -> tuple[tuple[int, ...], ...]:
+    """Neighbor flat indices for every cell, ordered up, down, left, right."""
+    adjacency = []
+    for idx in range(108):
+        col, row_idx = divmod(idx, 9)
+        neighbors = []
+        if row_idx > 0:
+            neighbors.append(idx - 1)
+        if row_idx < 8:
+            neighbors.append(idx + 1)
+        if col > 0:
+            neighbors.append(idx - 9)
+        if col < 11:
+            neighbors.append(idx + 9)
+        adjacency.append(tuple(neighbors))
+    return tuple(adjacency)
+
+
+# Flat index -> neighbor flat indices, computed once at import time
+_ADJACENT: tuple[tuple[int, ...], ...] = _build_adjacency()
+
+# Bitboard masks over flat indices; bit i is set for cell i
+_ROW_A_MASK = sum(1 << (col * 9) for col in range(12))
+_ROW_I_MASK = sum(1 << (col * 9 + 8) for col in range(12))
+_NOT_ROW_A = ~_ROW_A_MASK
+_NOT_ROW_I = ~_ROW_I_MASK
+_ALL_CELLS = (1 << 108) - 1
+
+# Flat index -> bitboard of its neighbors
+_NEIGHBOR_MASK: tuple[int, ...] = tuple(
+    sum(1 << n for n in neighbors) for neighbors in _ADJACENT
+)
+
+
+def _spread(mask: int) -> int:
+    """Cells orthogonally adjacent to any cell of a bitboard.
+
+    Row masks stop vertical steps wrapping between columns; the result can
+    have bits past the last cell, so mask with _ALL_CELLS where it matters.
+    """
+    return (
+        ((mask & _NOT_ROW_A) >> 1)
+        | ((mask & _NOT_ROW_I) << 1)
+        | (mask >> 9)
+        | (mask << 9)
+    )
+
+
+def _iter_bits(mask: int):
+    """Yield the set bit positions of a bitboard, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
 class Board:
-    """12x9 game board for Acquire."""
+    """12x9 game board for Acquire.
+
+    Cell data is kept in flat, parallel lists (struct-of-arrays) indexed by
+    ``(column - 1) * 9 + row_index`` rather than one object per cell.
+    """
 
     COLUMNS = 12
     ROWS = "ABCDEFGHI"
+    CELL_COUNT = 108
 
     def __init__(self):
-        self._grid: dict[tuple[int, str], BoardCell] = {}
-        self._initialize_grid()
-
-    def _initialize_grid(self):
-        """Create empty 12x9 grid."""
-        for col in range(1, self.COLUMNS + 1):
-            for row in self.ROWS:
-                self._grid[(col, row)] = BoardCell()
+        self._state: list[TileState] = [_EMPTY] * self.CELL_COUNT
+        # Bitboard of non-empty cells (PLAYED or IN_CHAIN)
+        self._occupied = 0
+        self._chain: list[Optional[str]] = [None] * self.CELL_COUNT
+        # Chain name -> bitboard of its tiles, maintained incrementally
+        self._chain_bb: dict[str, int] = {}
+        # Bumped on every change, so derived queries can be memoized
+        self.version = 0
+        # Flat index -> (adjacent chains, adjacent played count), valid only
+        # while _adjacency_version == version
+        self._adjacency: dict[int, tuple[list[str], int]] = {}
+        self._adjacency_version = 0
+        # (version, safe_size) -> empty cells touching two or more safe chains
+        self._safe_merge: tuple[int, int, int] = (-1, 0, 0)
+
+    def copy(self) -> "Board":
+        """Get an independent copy of this board."""
+        board = Board.__new__(Board)
+        board._state = self._state.copy()
+        board._occupied = self._occupied
+        board._chain = self._chain.copy()
+        board._chain_bb = self._chain_bb.copy()
+        board.version = self.version
+        board._adjacency = {}
+        board._adjacency_version = self.version
+        board._safe_merge = self._safe_merge
+        return board
 
     def get_cell(self, column: int, row: str) -> BoardCell:
-        """Get the cell at given coordinates."""
-        return self._grid[(column, row)]
+        """Get a snapshot of the cell at given coordinates."""
+        idx = _cell_index(column, row)
+        return BoardCell(self._state[idx], self._chain[idx])
 
     def place_tile(self, tile: Tile) -> bool:
         """Place a tile on the board. Returns True if successful."""
-        cell = self._grid[tile.coords]
-        if cell.state != TileState.EMPTY:
+        idx = _cell_index(tile.column, tile.row)
+        if self._state[idx] is not _EMPTY:
             return False
-        cell.state = TileState.PLAYED
+        self._state[idx] = _PLAYED
+        self._occupied |= 1 << idx
+        self.version += 1
         return True
 
     def set_chain(self, tile: Tile, chain_name: str):
         """Assign a tile to a hotel chain."""
-        cell = self._grid[tile.coords]
-        cell.state = TileState.IN_CHAIN
-        cell.chain = chain_name
+        idx = _cell_index(tile.column, tile.row)
+        previous = self._chain[idx]
+        if previous == chain_name:
+            return
+        bit = 1 << idx
+        if previous is not None:
+            self._discard_from_chain(previous, bit)
+        self._state[idx] = _IN_CHAIN
+        self._occupied |= bit
+        self._chain[idx] = chain_name
+        self._chain_bb[chain_name] = self._chain_bb.get(chain_name, 0) | bit
+        self.version += 1
+
+    def _discard_from_chain(self, chain_name: str, bit: int):
+        """Drop a cell's bit from a chain, forgetting the chain if emptied."""
+        remaining = self._chain_bb[chain_name] & ~bit
+        if remaining:
+            self._chain_bb[chain_name] = remaining
+        else:
+            del self._chain_bb[chain_name]
+
+    def _tile_at(self, idx: int) -> Tile:
+        """Get the Tile for a flat cell index."""
+        return _ALL_TILES[idx]
 
     def get_adjacent_tiles(self, tile: Tile) -> list[Tile]:
         """Get all adjacent tiles (up, down, left, right)."""
-        col, row = tile.coords
-        row_idx = self.ROWS.index(row)
-        adjacent = []
-
-        # Up
-        if row_idx > 0:
-            adjacent.append(Tile(col, self.ROWS[row_idx - 1]))
-        # Down
-        if row_idx < len(self.ROWS) - 1:
-            adjacent.append(Tile(col, self.ROWS[row_idx + 1]))
-        # Left
-        if col > 1:
-            adjacent.append(Tile(col - 1, row))
-        # Right
-        if col < self.COLUMNS:
-            adjacent.append(Tile(col + 1, row))
-
-        return adjacent
+        return [self._tile_at(n) for n in _ADJACENT[_cell_index(tile.column, tile.row)]]
 
     def get_adjacent_played_tiles(self, tile: Tile) -> list[Tile]:
         """Get adjacent tiles that have been played (PLAYED or IN_CHAIN)."""
-        adjacent = self.get_adjacent_tiles(tile)
-        return [t for t in adjacent if self._grid[t.coords].state != TileState.EMPTY]
+        state = self._state
+        return [
+            self._tile_at(n)
+            for n in _ADJACENT[_cell_index(tile.column, tile.row)]
+            if state[n] is not _EMPTY
+        ]
 
     def get_adjacent_chains(self, tile: Tile) -> list[str]:
         """Get unique chain names adjacent to a tile (sorted for determinism)."""
-        adjacent = self.get_adjacent_tiles(tile)
-        chains = set()
-        for t in adjacent:
-            cell = self._grid[t.coords]
-            if cell.chain:
-                chains.add(cell.chain)
-        return sorted(chains)
+        return self._adjacent_chains_at(_cell_index(tile.column, tile.row))
+
+    def _adjacent_chains_at(self, idx: int) -> list[str]:
+        """Sorted unique chain names around a flat cell index."""
+        # At most four neighbors, so a list membership test beats a set
+        chain = self._chain
+        chains = []
+        for n in _ADJACENT[idx]:
+            name = chain[n]
+            if name is not None and name not in chains:
+                chains.append(name)
+        if len(chains) > 1:
+            chains.sort()
+        return chains
+
+    def get_adjacency(self, tile: Tile) -> tuple[list[str], int]:
+        """Get (adjacent chains, number of adjacent played tiles) for a tile.
+
+        Memoized until the board next changes, so repeated rule checks on
+        the same tile scan its neighbors once. Treat the list as read-only.
+        """
+        if self._adjacency_version != self.version:
+            self._adjacency = {}
+            self._adjacency_version = self.version
+        idx = _cell_index(tile.column, tile.row)
+        entry = self._adjacency.get(idx)
+        if entry is None:
+            played = (self._occupied & _NEIGHBOR_MASK[idx]).bit_count()
+            entry = (self._adjacent_chains_at(idx), played)
+            self._adjacency[idx] = entry
+        return entry
 
     def get_chain_tiles(self, chain_name: str) -> list[Tile]:
         """Get all tiles belonging to a chain."""
-        tiles = []
-        for (col, row), cell in self._grid.items():
-            if cell.chain == chain_name:
-                tiles.append(Tile(col, row))
-        return tiles
+        return [
+            self._tile_at(idx) for idx in _iter_bits(self._chain_bb.get(chain_name, 0))
+        ]
 
     def get_chain_size(self, chain_name: str) -> int:
         """Get the number of tiles in a chain."""
-        return sum(1 for cell in self._grid.values() if cell.chain == chain_name)
+        return self._chain_bb.get(chain_name, 0).bit_count()
+
+    def _connected_indices(self, start: int) -> int:
+        """Bitset of flat indices reachable from start through played cells.
+
+        Grows the region by shifting it one step in every direction and
+        masking with the occupancy bitboard until it stops changing. Row
+        masks stop vertical shifts from wrapping into the next column;
+        horizontal shifts past either edge fall outside the occupancy bits.
+        """
+        occupied = self._occupied
+        region = 1 << start
+        while True:
+            grown = (
+                region
+                | ((region & _NOT_ROW_A) >> 1)
+                | ((region & _NOT_ROW_I) << 1)
+                | (region >> 9)
+                | (region << 9)
+            ) & occupied
+            if grown == region:
+                return region
+            region = grown
 
     def get_connected_tiles(self, start_tile: Tile) -> set[Tile]:
         """Get all tiles connected to start_tile (flood fill of played tiles)."""
-        if self._grid[start_tile.coords].state == TileState.EMPTY:
+        start = _cell_index(start_tile.column, start_tile.row)
+        if self._state[start] is _EMPTY:
             return set()
 
-        visited = set()
-        to_visit = [start_tile]
-
-        while to_visit:
-            current = to_visit.pop()
-            if current in visited:
-                continue
-            visited.add(current)
-
-            for adj in self.get_adjacent_tiles(current):
-                if (
-                    adj not in visited
-                    and self._grid[adj.coords].state != TileState.EMPTY
-                ):
-                    to_visit.append(adj)
-
-        return visited
+        return {_ALL_TILES[idx] for idx in _iter_bits(self._connected_indices(start))}
+
+    def assign_chain_to_connected_unassigned(self, tile: Tile, chain_name: str):
+        """Put every unchained tile connected to tile into chain_name."""
+        start = _cell_index(tile.column, tile.row)
+        if self._state[start] is _EMPTY:
+            return
+
+        # Chained cells are exactly the union of the chain bitboards
+        chained = 0
+        for bb in self._chain_bb.values():
+            chained |= bb
+        added = self._connected_indices(start) & ~chained
+        if not added:
+            return
+
+        state = self._state
+        chain = self._chain
+        for idx in _iter_bits(added):
+            state[idx] = _IN_CHAIN
+            chain[idx] = chain_name
+        self._chain_bb[chain_name] = self._chain_bb.get(chain_name, 0) | added
+        self.version += 1
 
     def merge_chains(self, surviving_chain: str, defunct_chain: str):
         """Merge defunct chain into surviving chain."""
-        for (col, row), cell in self._grid.items():
-            if cell.chain == defunct_chain:
-                cell.chain = surviving_chain
+        if surviving_chain == defunct_chain:
+            return
+        moved = self._chain_bb.pop(defunct_chain, 0)
+        if not moved:
+            return
+        chain = self._chain
+        for idx in _iter_bits(moved):
+            chain[idx] = surviving_chain
+        self._chain_bb[surviving_chain] = self._chain_bb.get(surviving_chain, 0) | moved
+        self.version += 1
+
+    def get_safe_merge_mask(self, safe_size: int) -> int:
+        """Bitboard of empty cells adjacent to two or more chains of safe_size+.
+
+        Each safe chain's border is found by shifting its bitboard one step
+        in every direction; cells seen in two borders are collected in a
+        second mask. Memoized until the board next changes.
+        """
+        version, cached_size, mask = self._safe_merge
+        if version == self.version and cached_size == safe_size:
+            return mask
+        seen = mask = 0
+        for bb in self._chain_bb.values():
+            if bb.bit_count() < safe_size:
+                continue
+            border = _spread(bb)
+            mask |= seen & border
+            seen |= border
+        mask &= _ALL_CELLS & ~self._occupied
+        self._safe_merge = (self.version, safe_size, mask)
+        return mask
+
+    def get_unplayable_mask(self, safe_size: int, can_found: bool) -> int:
+        """Bitboard of cells a tile cannot legally be played on.
+
+        Covers occupied cells, cells that would merge two or more chains of
+        safe_size+, and, unless can_found, cells that would found a chain
+        (next to a played tile but not to any chain).
+        """
+        occupied = self._occupied
+        mask = occupied | self.get_safe_merge_mask(safe_size)
+        if not can_found:
+            in_chains = 0
+            for bb in self._chain_bb.values():
+                in_chains |= bb
+            mask |= _spread(occupied) & ~_spread(in_chains) & _ALL_CELLS
+        return mask
+
+    @staticmethod
+    def cell_bit(tile: Tile) -> int:
+        """The bit for a tile's cell in this module's bitboards."""
+        return 1 << _cell_index(tile.column, tile.row)
+
+    def would_merge_safe_chains(self, tile: Tile, safe_size: int) -> bool:
+        """Check if playing a tile would join two or more chains of safe_size+."""
+        idx = _cell_index(tile.column, tile.row)
+        return bool(self.get_safe_merge_mask(safe_size) >> idx & 1)
 
     def get_all_chains(self) -> set[str]:
         """Get all active chain names on the board."""
-        chains = set()
-        for cell in self._grid.values():
-            if cell.chain:
-                chains.add(cell.chain)
-        return chains
+        return set(self._chain_bb)
+
+    def get_chain_sizes(self) -> dict[str, int]:
+        """Get the size of every chain on the board in one pass."""
+        return {name: bb.bit_count() for name, bb in self._chain_bb.items()}
 
     def is_tile_played(self, tile: Tile) -> bool:
         """Check if a tile has been played."""
-        return self._grid[tile.coords].state != TileState.EMPTY
+        return bool(self._occupied >> _cell_index(tile.column, tile.row) & 1)
 
     def get_state(self) -> dict:
         """Get serializable board state."""
-        cells = {}
-        for (col, row), cell in self._grid.items():
-            if cell.state != TileState.EMPTY:
-                cells[f"{col}{row}"] = {"state": cell.state.value, "chain": cell.chain}
-        return {"cells": cells}
+        return {
+            "cells": {
+                label: {"state": state.value, "chain": chain}
+                for label, state, chain in zip(_CELL_LABELS, self._state, self._chain)
+                if state is not _EMPTY
+            }
+        }
+
+    def get_state_arrays(
+        self,
+    ) -> tuple[tuple[TileState, ...], tuple[Optional[str], ...]]:
+        """Get raw per-cell (states, chains), indexed (column - 1) * 9 + row_index.
+
+        Cheaper than get_state() for callers that encode the whole board.
+        """
+        return tuple(self._state), tuple(self._chain)
 
     @classmethod
     def all_tiles(cls) -> list[Tile]:
-        """Generate all 108 tiles."""
-        tiles = []
-        for col in range(1, cls.COLUMNS + 1):
-            for row in cls.ROWS:
-                tiles.append(Tile(col, row))
-        return tiles
+        """Get a new list of all 108 tiles."""
+        return list(_ALL_TILES)
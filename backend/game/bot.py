@@ -1,16 +1,186 @@
 """AI player for Acquire board game."""
 
+import heapq
 import random
+from collections.abc import Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Optional
 
 from game.board import Board, Tile
 from game.hotel import Hotel, HotelTier
 from game.player import Player
+from game.rules import Rules
+
+# One bit per hotel chain, for set operations on chain groups
+_CHAIN_BIT = MappingProxyType({name: 1 << i for i, name in enumerate(Hotel.CHAINS)})
+
+# Sort key for (score, choice) pairs
+_SCORE = itemgetter(0)
+# Sort key for (score, tiebreak, choice) triples
+_RANK = itemgetter(0, 1)
+
+# Difficulty levels as small ints so per-decision checks are int compares
+_EASY, _MEDIUM, _HARD = 0, 1, 2
+_DIFFICULTY_LEVELS = MappingProxyType({"easy": _EASY, "medium": _MEDIUM, "hard": _HARD})
+
+# Per-chain constants, resolved once at import instead of per decision
+_CHAIN_TIER = MappingProxyType(
+    {name: chain.tier for name, chain in Hotel.CHAINS.items()}
+)
+_SURVIVOR_TIER_BONUS = MappingProxyType(
+    {
+        name: {HotelTier.EXPENSIVE: 2, HotelTier.MEDIUM: 1, HotelTier.CHEAP: 0}[tier]
+        for name, tier in _CHAIN_TIER.items()
+    }
+)
+_BUY_TIER_BONUS = MappingProxyType(
+    {
+        name: {HotelTier.EXPENSIVE: 10, HotelTier.MEDIUM: 5, HotelTier.CHEAP: 0}[tier]
+        for name, tier in _CHAIN_TIER.items()
+    }
+)
+
+
+def _score_tile_features(
+    adjacent_played: int,
+    adjacent_chains: int,
+    surviving_stock: int,
+    defunct_stock: int,
+    has_inactive: bool,
+) -> float:
+    """Score a tile from its extracted features (see Bot._tile_features)."""
+    score = 0.0
+
+    # Would connect with lone tiles to found a new chain
+    if adjacent_played > 0 and adjacent_chains == 0 and has_inactive:
+        score += 100  # High priority for founding
+
+    if adjacent_chains == 1:
+        # Expands a chain; bonus if we have stock in it
+        if surviving_stock > 0:
+            score += 50 + surviving_stock * 5
+    elif adjacent_chains >= 2:
+        # Triggers a merger
+        if surviving_stock > 0:
+            score += 30 + surviving_stock * 3  # Good if we own the survivor
+        if defunct_stock > 0:
+            score += 20 + defunct_stock * 2  # Bonuses from defunct chains
+
+    return score
+
+
+def _run_rollout(args: tuple[int, tuple[str, ...], int]) -> list[dict]:
+    """Play one all-bot game to the end and return its final standings.
+
+    Module-level so ProcessPoolExecutor can pickle it.
+
+    Args:
+        args: (seed, bot difficulties in seat order, turn limit)
+
+    Returns:
+        Final standings as dicts, in rank order
+    """
+    # Imported here because game.game imports this module
+    from game.game import Game
+
+    seed, difficulties, max_turns = args
+    game = Game(seed=seed)
+    for i, difficulty in enumerate(difficulties):
+        game.add_player(f"bot{i}", f"Bot {i}", is_bot=True, bot_difficulty=difficulty)
+    game.start_game()
+
+    for _ in range(max_turns):
+        if Rules.check_end_game(game.board, game.hotel):
+            break
+        if not game.execute_bot_turn(game.get_current_player_id()):
+            break
+
+    result = game.end_game()
+    return [standing.to_dict() for standing in result.standings]
+
+
+class _BoardQueryCache:
+    """Memoizes board/hotel queries for the duration of one bot decision.
+
+    The board does not change while a bot is choosing, so each adjacency,
+    chain-size and safety lookup only needs to run once.
+    """
+
+    def __init__(self, board: Board, hotel: Hotel):
+        self.board = board
+        self.hotel = hotel
+        self._adjacent_chains: dict[Tile, list[str]] = {}
+        self._adjacent_played: dict[Tile, list[Tile]] = {}
+        self._chain_sizes: dict[str, int] = {}
+        self._safe: dict[str, bool] = {}
+        self._safe_mask: Optional[int] = None
+        self._has_inactive: Optional[bool] = None
+
+    def adjacent_chains(self, tile: Tile) -> list[str]:
+        """Cached Board.get_adjacent_chains."""
+        chains = self._adjacent_chains.get(tile)
+        if chains is None:
+            chains = self.board.get_adjacent_chains(tile)
+            self._adjacent_chains[tile] = chains
+        return chains
+
+    def adjacent_played(self, tile: Tile) -> list[Tile]:
+        """Cached Board.get_adjacent_played_tiles."""
+        played = self._adjacent_played.get(tile)
+        if played is None:
+            played = self.board.get_adjacent_played_tiles(tile)
+            self._adjacent_played[tile] = played
+        return played
+
+    def chain_size(self, chain_name: str) -> int:
+        """Cached Board.get_chain_size."""
+        size = self._chain_sizes.get(chain_name)
+        if size is None:
+            size = self.board.get_chain_size(chain_name)
+            self._chain_sizes[chain_name] = size
+        return size
+
+    def is_safe(self, chain_name: str) -> bool:
+        """Cached Hotel.is_chain_safe at the chain's current size."""
+        safe = self._safe.get(chain_name)
+        if safe is None:
+            safe = self.hotel.is_chain_safe(chain_name, self.chain_size(chain_name))
+            self._safe[chain_name] = safe
+        return safe
+
+    def adjacent_chain_mask(self, tile: Tile) -> int:
+        """Bitmask (see _CHAIN_BIT) of the chains adjacent to a tile."""
+        mask = 0
+        for chain_name in self.adjacent_chains(tile):
+            mask |= _CHAIN_BIT[chain_name]
+        return mask
+
+    @property
+    def has_inactive(self) -> bool:
+        """Whether any chain is still available to be founded."""
+        if self._has_inactive is None:
+            self._has_inactive = bool(self.hotel.get_inactive_chains())
+        return self._has_inactive
+
+    @property
+    def safe_mask(self) -> int:
+        """Bitmask of every chain on the board that is currently safe."""
+        if self._safe_mask is None:
+            self._safe_mask = 0
+            for chain_name in self.board.get_all_chains():
+                if self.is_safe(chain_name):
+                    self._safe_mask |= _CHAIN_BIT[chain_name]
+        return self._safe_mask
 
 
 class Bot:
     """AI player for Acquire."""
 
+    __slots__ = ("_level", "difficulty", "player", "rng")
+
     def __init__(
         self,
         player: Player,
@@ -27,10 +197,41 @@ class Bot:
         self.player = player
         self.difficulty = difficulty
         self.rng = rng if rng is not None else random.Random()
-        if difficulty not in ("easy", "medium", "hard"):
+        if difficulty not in _DIFFICULTY_LEVELS:
             raise ValueError(f"Invalid difficulty: {difficulty}")
+        self._level = _DIFFICULTY_LEVELS[difficulty]
+
+    @staticmethod
+    def simulate_games(
+        seeds: Sequence[int],
+        difficulties: Sequence[str],
+        max_turns: int = 500,
+        workers: Optional[int] = None,
+    ) -> list[list[dict]]:
+        """Play independent all-bot games in parallel worker processes.
+
+        Each rollout is fully determined by its seed, so results match a
+        serial run regardless of worker count.
+
+        Args:
+            seeds: One RNG seed per game
+            difficulties: Difficulty of each bot seat (3-6 entries)
+            max_turns: Turn limit per game before it is scored as-is
+            workers: Process count (defaults to the CPU count)
 
-    def choose_tile_to_play(self, board: Board, hotel: Hotel) -> Optional[Tile]:
+        Returns:
+            Final standings for each game, in the order of seeds
+        """
+        jobs = [(seed, tuple(difficulties), max_turns) for seed in seeds]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_run_rollout, jobs))
+
+    def choose_tile_to_play(
+        self,
+        board: Board,
+        hotel: Hotel,
+        pending_tiles: Optional[AbstractSet[Tile]] = None,
+    ) -> Optional[Tile]:
         """Select which tile to play from hand.
 
         Strategy:
@@ -42,100 +243,123 @@ class Bot:
         Args:
             board: Current game board
             hotel: Hotel chain manager
+            pending_tiles: Tiles already claimed by other in-flight searches
+                sharing this bot (e.g. parallel rollouts); they are skipped
 
         Returns:
             Tile to play, or None if no valid tiles
         """
-        valid_tiles = self._get_playable_tiles(board, hotel)
+        cache = _BoardQueryCache(board, hotel)
+        valid_tiles = self._get_playable_tiles(board, hotel, cache)
+        if pending_tiles:
+            valid_tiles = [t for t in valid_tiles if t not in pending_tiles]
         if not valid_tiles:
             return None
 
-        if self.difficulty == "easy":
+        if self._level == _EASY:
             return self.rng.choice(valid_tiles)
 
-        # Score each tile
-        scored_tiles = []
+        if self._level == _MEDIUM:
+            # Medium: pick from top 3 with some randomness. Keep a bounded
+            # min-heap of (score, -position) so that, as with a stable sort,
+            # earlier tiles win ties.
+            heap: list[tuple[float, int, Tile]] = []
+            for i, tile in enumerate(valid_tiles):
+                entry = (self._score_tile(tile, board, hotel, cache), -i, tile)
+                if len(heap) < 3:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+            top_tiles = sorted(heap, key=_RANK, reverse=True)
+            return self.rng.choice(top_tiles)[2]
+
+        # Hard: always pick the best (first tile wins ties)
+        best_tile = None
+        best_score = float("-inf")
         for tile in valid_tiles:
-            score = self._score_tile(tile, board, hotel)
-            scored_tiles.append((score, tile))
-
-        # Sort by score descending
-        scored_tiles.sort(key=lambda x: x[0], reverse=True)
+            score = self._score_tile(tile, board, hotel, cache)
+            if score > best_score:
+                best_score, best_tile = score, tile
+        return best_tile
 
-        if self.difficulty == "medium":
-            # Medium: pick from top 3 with some randomness
-            top_tiles = scored_tiles[:3]
-            return self.rng.choice(top_tiles)[1]
-        else:
-            # Hard: always pick the best
-            return scored_tiles[0][1]
-
-    def _get_playable_tiles(self, board: Board, hotel: Hotel) -> list[Tile]:
+    def _get_playable_tiles(
+        self,
+        board: Board,
+        hotel: Hotel,
+        cache: Optional[_BoardQueryCache] = None,
+    ) -> list[Tile]:
         """Get tiles from hand that can be legally played.
 
         A tile is unplayable if it would merge two or more safe chains.
         """
+        if cache is None:
+            cache = _BoardQueryCache(board, hotel)
         playable = []
         for tile in self.player.hand:
             if board.is_tile_played(tile):
                 continue
 
             # Check for illegal merge (two or more safe chains)
-            adjacent_chains = board.get_adjacent_chains(tile)
-            if len(adjacent_chains) >= 2:
-                safe_chains = [
-                    c
-                    for c in adjacent_chains
-                    if hotel.is_chain_safe(c, board.get_chain_size(c))
-                ]
-                if len(safe_chains) >= 2:
+            if len(cache.adjacent_chains(tile)) >= 2:
+                safe_adjacent = cache.adjacent_chain_mask(tile) & cache.safe_mask
+                if safe_adjacent.bit_count() >= 2:
                     continue  # Illegal - would merge safe chains
 
             playable.append(tile)
         return playable
 
-    def _score_tile(self, tile: Tile, board: Board, hotel: Hotel) -> float:
+    def _score_tile(
+        self,
+        tile: Tile,
+        board: Board,
+        hotel: Hotel,
+        cache: Optional[_BoardQueryCache] = None,
+    ) -> float:
         """Score a tile based on strategic value."""
-        score = 0.0
+        if cache is None:
+            cache = _BoardQueryCache(board, hotel)
+        return _score_tile_features(
+            *self._tile_features(tile, cache), cache.has_inactive
+        )
 
-        adjacent_played = board.get_adjacent_played_tiles(tile)
-        adjacent_chains = board.get_adjacent_chains(tile)
+    def _tile_features(
+        self, tile: Tile, cache: _BoardQueryCache
+    ) -> tuple[int, int, int, int]:
+        """Extract the numeric inputs to tile scoring.
 
-        # Check if this tile would found a new chain
-        if len(adjacent_played) > 0 and len(adjacent_chains) == 0:
-            # Would connect with lone tiles to found a chain
-            inactive_chains = hotel.get_inactive_chains()
-            if inactive_chains:
-                score += 100  # High priority for founding
+        Returns:
+            (adjacent played tiles, adjacent chains, stock held in the chain
+            that would survive or expand, stock held in chains that would
+            become defunct)
+        """
+        adjacent_played = cache.adjacent_played(tile)
+        adjacent_chains = cache.adjacent_chains(tile)
+        get_stock_count = self.player.get_stock_count
 
-        # Check if this expands a chain we have stock in
+        surviving_stock = 0
+        defunct_stock = 0
         if len(adjacent_chains) == 1:
-            chain_name = adjacent_chains[0]
-            stock_count = self.player.get_stock_count(chain_name)
-            if stock_count > 0:
-                score += 50 + stock_count * 5  # Bonus for expanding owned chains
-
-        # Check if this triggers a merger
-        if len(adjacent_chains) >= 2:
+            surviving_stock = get_stock_count(adjacent_chains[0])
+        elif len(adjacent_chains) == 2:
+            # Common two-way merger: larger chain survives (first on a tie)
+            a, b = adjacent_chains
+            if cache.chain_size(a) >= cache.chain_size(b):
+                surviving_stock, defunct_stock = get_stock_count(a), get_stock_count(b)
+            else:
+                surviving_stock, defunct_stock = get_stock_count(b), get_stock_count(a)
+        elif len(adjacent_chains) > 2:
             # Find which chain would survive (largest)
-            chain_sizes = [(c, board.get_chain_size(c)) for c in adjacent_chains]
+            chain_sizes = [(c, cache.chain_size(c)) for c in adjacent_chains]
             chain_sizes.sort(key=lambda x: x[1], reverse=True)
+            surviving_stock = get_stock_count(chain_sizes[0][0])
+            defunct_stock = sum(get_stock_count(c) for c, _ in chain_sizes[1:])
 
-            # Check if we have stock in the surviving chain
-            surviving_chain = chain_sizes[0][0]
-            surviving_stock = self.player.get_stock_count(surviving_chain)
-
-            # Check total stock in defunct chains (for bonuses)
-            defunct_stock = sum(
-                self.player.get_stock_count(c) for c, _ in chain_sizes[1:]
-            )
-
-            if surviving_stock > 0:
-                score += 30 + surviving_stock * 3  # Good if we own the survivor
-            if defunct_stock > 0:
-                score += 20 + defunct_stock * 2  # Bonuses from defunct chains
-
-        return score
+        return (
+            len(adjacent_played),
+            len(adjacent_chains),
+            surviving_stock,
+            defunct_stock,
+        )
 
     def choose_chain_to_found(self, available_chains: list[str], board: Board) -> str:
         """Choose which chain to found.
@@ -152,7 +376,7 @@ class Bot:
         if not available_chains:
             raise ValueError("No chains available to found")
 
-        if self.difficulty == "easy":
+        if self._level == _EASY:
             return self.rng.choice(available_chains)
 
         # Categorize by tier
@@ -163,8 +387,7 @@ class Bot:
         }
 
         for chain_name in available_chains:
-            chain = Hotel.get_chain(chain_name)
-            chains_by_tier[chain.tier].append(chain_name)
+            chains_by_tier[_CHAIN_TIER[chain_name]].append(chain_name)
 
         # Decide based on cash situation
         if self.player.money < 1500:
@@ -176,7 +399,7 @@ class Bot:
 
         for tier in preference_order:
             if chains_by_tier[tier]:
-                if self.difficulty == "hard":
+                if self._level == _HARD:
                     return chains_by_tier[tier][0]
                 else:
                     return self.rng.choice(chains_by_tier[tier])
@@ -205,31 +428,24 @@ class Bot:
         if len(tied_chains) == 1:
             return tied_chains[0]
 
-        if self.difficulty == "easy":
+        if self._level == _EASY:
             return self.rng.choice(tied_chains)
 
         # Score by stock ownership
         scored_chains = []
         for chain_name in tied_chains:
             stock_count = self.player.get_stock_count(chain_name)
-            chain = Hotel.get_chain(chain_name)
             # Prefer chains we own stock in; tiebreak by tier value
-            tier_bonus = {
-                HotelTier.EXPENSIVE: 2,
-                HotelTier.MEDIUM: 1,
-                HotelTier.CHEAP: 0,
-            }
-            score = stock_count * 10 + tier_bonus[chain.tier]
+            score = stock_count * 10 + _SURVIVOR_TIER_BONUS[chain_name]
             scored_chains.append((score, chain_name))
 
-        scored_chains.sort(key=lambda x: x[0], reverse=True)
-
-        if self.difficulty == "medium":
-            # Some randomness among top choices
+        if self._level == _MEDIUM:
+            # Some randomness among top choices (kept in score order)
+            scored_chains.sort(key=_SCORE, reverse=True)
             top = [c for s, c in scored_chains if s >= scored_chains[0][0] - 5]
             return self.rng.choice(top) if top else scored_chains[0][1]
 
-        return scored_chains[0][1]
+        return max(scored_chains, key=_SCORE)[1]
 
     def choose_stock_disposition(
         self,
@@ -258,7 +474,7 @@ class Bot:
         if defunct_count == 0:
             return {"sell": 0, "trade": 0, "keep": 0}
 
-        if self.difficulty == "easy":
+        if self._level == _EASY:
             # Easy: random split
             sell = self.rng.randint(0, defunct_count)
             remaining = defunct_count - sell
@@ -284,7 +500,7 @@ class Bot:
         sell = 0
         keep = 0
 
-        if self.difficulty == "hard":
+        if self._level == _HARD:
             # Hard: optimize based on value comparison
             if trade_value > sell_value and max_tradeable > 0:
                 # Trading is more valuable
@@ -315,7 +531,11 @@ class Bot:
         return {"sell": sell, "trade": trade, "keep": keep}
 
     def choose_stocks_to_buy(
-        self, board: Board, hotel: Hotel, max_stocks: int = 3
+        self,
+        board: Board,
+        hotel: Hotel,
+        max_stocks: int = 3,
+        pending_purchases: Optional[Mapping[str, int]] = None,
     ) -> list[str]:
         """Choose which stocks to buy (up to 3 per turn).
 
@@ -327,79 +547,78 @@ class Bot:
             board: Current game board
             hotel: Hotel chain manager
             max_stocks: Maximum number of stocks to buy (default 3)
+            pending_purchases: Shares per chain already claimed by other
+                in-flight searches; treated as unavailable
 
         Returns:
             List of chain names to buy (length <= max_stocks)
         """
-        active_chains = hotel.get_active_chains()
-        if not active_chains:
+        active = hotel.snapshot_active(board)
+        if not active:
             return []
 
         purchases = []
+        purchase_counts: dict[str, int] = {}
+        spent = 0
+
+        # Local aliases for the per-chain loops below
+        level = self._level
+        rng = self.rng
+        money = self.player.money
+        low_on_money = money < 2000
+        get_owned = self.player.get_stock_count
+
+        # Everything but the diversification bonus is fixed for the turn, so
+        # score each chain once up front: (chain, price, base score)
+        candidates = []
+        for chain_name, (available, size, price) in active.items():
+            if pending_purchases:
+                available -= pending_purchases.get(chain_name, 0)
+            if available <= 0:
+                continue
+            base = 0.0
+            if level != _EASY:
+                # Prefer chains we own (building toward majority)
+                owned = get_owned(chain_name)
+                if owned > 0:
+                    base += 20 + owned * 3
+                # Prefer larger chains (more stable)
+                base += size * 2
+                # Prefer cheaper stocks when low on money
+                if low_on_money:
+                    base += (1200 - price) / 100
+                # Prefer higher tier chains
+                base += _BUY_TIER_BONUS[chain_name]
+            candidates.append((chain_name, price, base))
+
+        prices = {chain_name: price for chain_name, price, _ in candidates}
 
         for _ in range(max_stocks):
             # Find affordable chains with available stock
-            affordable = []
-            for chain_name in active_chains:
-                if hotel.get_available_stocks(chain_name) <= 0:
-                    continue
-
-                size = board.get_chain_size(chain_name)
-                price = hotel.get_stock_price(chain_name, size)
-
-                if price <= self.player.money - sum(
-                    hotel.get_stock_price(c, board.get_chain_size(c)) for c in purchases
-                ):
-                    affordable.append((chain_name, price, size))
+            budget = money - spent
+            affordable = [c for c in candidates if c[1] <= budget]
 
             if not affordable:
                 break
 
-            if self.difficulty == "easy":
-                choice = self.rng.choice(affordable)[0]
+            if level == _EASY:
+                choice = rng.choice(affordable)[0]
             else:
-                # Score chains
-                scored = []
-                for chain_name, price, size in affordable:
-                    score = 0.0
-                    owned = self.player.get_stock_count(chain_name)
-                    already_buying = purchases.count(chain_name)
-
-                    # Prefer chains we own (building toward majority)
-                    if owned > 0:
-                        score += 20 + owned * 3
-
-                    # Prefer chains we're not already buying this turn (diversify)
-                    if already_buying == 0:
-                        score += 15
-
-                    # Prefer larger chains (more stable)
-                    score += size * 2
-
-                    # Prefer cheaper stocks when low on money
-                    if self.player.money < 2000:
-                        score += (1200 - price) / 100
-
-                    # Prefer higher tier chains
-                    chain = Hotel.get_chain(chain_name)
-                    tier_bonus = {
-                        HotelTier.EXPENSIVE: 10,
-                        HotelTier.MEDIUM: 5,
-                        HotelTier.CHEAP: 0,
-                    }
-                    score += tier_bonus[chain.tier]
-
-                    scored.append((score, chain_name))
-
-                scored.sort(key=lambda x: x[0], reverse=True)
-
-                if self.difficulty == "medium":
+                # Prefer chains we're not already buying this turn (diversify)
+                scored = [
+                    (base if chain_name in purchase_counts else base + 15, chain_name)
+                    for chain_name, _, base in affordable
+                ]
+
+                if level == _MEDIUM:
                     # Pick from top choices with some randomness
-                    top = scored[: min(3, len(scored))]
-                    choice = self.rng.choice(top)[1]
+                    top = heapq.nlargest(3, scored, key=_SCORE)
+                    choice = rng.choice(top)[1]
                 else:
-                    choice = scored[0][1]
+                    choice = max(scored, key=_SCORE)[1]
 
             purchases.append(choice)
+            purchase_counts[choice] = purchase_counts.get(choice, 0) + 1
+            spent += prices[choice]
 
         return purchases
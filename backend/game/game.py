@@ -1,11 +1,12 @@
 """Main game orchestration for Acquire board game."""
 
-from dataclasses import dataclass, field
-from enum import Enum
-from typing import Optional, Dict, List
+from collections import deque
+from dataclasses import dataclass, field, fields
+from enum import IntEnum
+from typing import Any, ClassVar, Optional, Dict, List, Union
 import random
 
-from game.board import Board, Tile, TileState
+from game.board import Board, Tile
 from game.action import TradeOffer
 from game.hotel import Hotel
 from game.player import Player
@@ -28,6 +29,9 @@ from game.responses import (
     DeclareEndGameResult,
 )
 
+# The seven chains are fixed, so build the name tuple once
+_ALL_CHAIN_NAMES = tuple(Hotel.get_all_chain_names())
+
 
 @dataclass
 class MergerState:
@@ -39,35 +43,158 @@ class MergerState:
 
     chains: list[str] = field(default_factory=list)  # All chains involved in merger
     survivor: Optional[str] = None  # The surviving chain
-    defunct_queue: list[str] = field(default_factory=list)  # Defunct chains to process
+    defunct_queue: deque[str] = field(
+        default_factory=deque
+    )  # Defunct chains to process
     current_defunct: Optional[str] = None  # Currently processing defunct chain
     stock_players: list[str] = field(
         default_factory=list
     )  # Players handling disposition
     stock_index: int = 0  # Current player index in disposition queue
     tile: Optional[Tile] = None  # The tile that triggered the merger
+    # Defunct chain sizes, fixed until the chains are merged at finalization
+    defunct_sizes: dict[str, int] = field(default_factory=dict)
 
     def reset(self) -> None:
         """Reset all merger state after completion."""
         self.chains = []
         self.survivor = None
-        self.defunct_queue = []
+        self.defunct_queue = deque()
         self.current_defunct = None
         self.stock_players = []
         self.stock_index = 0
         self.tile = None
+        self.defunct_sizes = {}
+
+    def copy(self) -> "MergerState":
+        """Get an independent copy of this merger state."""
+        return MergerState(
+            chains=list(self.chains),
+            survivor=self.survivor,
+            defunct_queue=deque(self.defunct_queue),
+            current_defunct=self.current_defunct,
+            stock_players=list(self.stock_players),
+            stock_index=self.stock_index,
+            tile=self.tile,
+            defunct_sizes=dict(self.defunct_sizes),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class GameSnapshot:
+    """Point-in-time copy of a game's mutable state, for Game.restore().
+
+    A snapshot is never modified, so one snapshot can seed any number of
+    restores (e.g. branching bot rollouts from the same position).
+    """
+
+    board: Board
+    hotel: dict
+    players: tuple[tuple[str, tuple], ...]  # (player_id, Player.snapshot())
+    tile_bag: tuple[Tile, ...]
+    current_player_index: int
+    phase: "GamePhase"
+    pending_action: Optional["PendingAction"]
+    merger: MergerState
+    pending_trades: tuple[TradeOffer, ...]
+    rng_state: tuple
+
+
+@dataclass(slots=True)
+class PendingAction:
+    """Base class for the decision the game is waiting on."""
+
+    type: ClassVar[str] = ""
+
+    def to_dict(self) -> dict:
+        """Convert to dict for state serialization."""
+        result = {"type": self.type}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            result[f.name] = str(value) if isinstance(value, Tile) else value
+        return result
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Support dict-like get() for test compatibility."""
+        if key == "type":
+            return self.type
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        """Support dict-like access for test compatibility."""
+        if key == "type":
+            return self.type
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+
+@dataclass(slots=True)
+class FoundChainAction(PendingAction):
+    """The current player must pick a chain to found."""
+
+    type: ClassVar[str] = "found_chain"
+
+    tile: Optional[Tile] = None  # The tile that formed the new group
+    available_chains: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ChooseSurvivorAction(PendingAction):
+    """The current player must break a tie for the merger survivor."""
+
+    type: ClassVar[str] = "choose_survivor"
+
+    tile: Optional[Tile] = None  # The tile that triggered the merger
+    tied_chains: list[str] = field(default_factory=list)
+
 
+@dataclass(slots=True)
+class StockDispositionAction(PendingAction):
+    """A stockholder must sell, trade or keep their defunct shares."""
 
-class GamePhase(Enum):
-    """Game phases that control what actions are valid."""
+    type: ClassVar[str] = "stock_disposition"
 
-    LOBBY = "lobby"
-    PLAYING = "playing"
-    TILE_PLAYED = "tile_played"
-    FOUNDING_CHAIN = "founding_chain"
-    MERGING = "merging"
-    BUYING_STOCKS = "buying_stocks"
-    GAME_OVER = "game_over"
+    player_id: Optional[str] = None
+    defunct_chain: Optional[str] = None
+    surviving_chain: Optional[str] = None
+    stock_count: int = 0
+    available_to_trade: int = 0
+
+
+_PENDING_ACTION_TYPES: dict[str, type[PendingAction]] = {
+    cls.type: cls
+    for cls in (FoundChainAction, ChooseSurvivorAction, StockDispositionAction)
+}
+
+
+def _pending_action_from_dict(data: dict) -> PendingAction:
+    """Build a PendingAction from its dict form, ignoring unknown keys."""
+    cls = _PENDING_ACTION_TYPES.get(data.get("type"))
+    if cls is None:
+        raise ValueError(f"Unknown pending action type: {data.get('type')}")
+    return cls(**{k: v for k, v in data.items() if k in cls.__slots__})
+
+
+class GamePhase(IntEnum):
+    """Game phases that control what actions are valid.
+
+    Integer-valued so the phase guards on every action compare as ints.
+    Use ``label`` (or ``_PHASE_TO_STRING``) for the string form.
+    """
+
+    LOBBY = 0
+    PLAYING = 1
+    TILE_PLAYED = 2
+    FOUNDING_CHAIN = 3
+    MERGING = 4
+    BUYING_STOCKS = 5
+    GAME_OVER = 6
+
+    @property
+    def label(self) -> str:
+        """Lowercase phase name, e.g. "buying_stocks"."""
+        return self.name.lower()
 
 
 # Phase string mapping - single source of truth for bidirectional conversion
@@ -102,17 +229,57 @@ class Game:
         self.board = Board()
         self.hotel = Hotel()
         self.players: list[Player] = []
+        self._players_by_id: dict[str, Player] = {}  # player_id -> Player
         self.bots: dict[str, Bot] = {}  # player_id -> Bot
         self.tile_bag: list[Tile] = []
-        self.current_player_index: int = 0
+        self._current_player: Optional[Player] = None
+        self._current_player_id: Optional[str] = None
+        self._current_player_index: int = 0
         self.phase: GamePhase = GamePhase.LOBBY
-        self.pending_action: Optional[dict] = None  # Track what action is needed
+        # Track what action is needed
+        self._pending_action: Optional[PendingAction] = None
 
         # Merger state tracking (consolidated into single object)
         self._merger = MergerState()
 
         # Player-to-player trading state
         self.pending_trades: Dict[str, TradeOffer] = {}  # trade_id -> TradeOffer
+        # player_id -> number of pending trades they proposed
+        self._pending_trades_by_proposer: dict[str, int] = {}
+
+    @property
+    def current_player_index(self) -> int:
+        """Get the seat index of the player whose turn it is."""
+        return self._current_player_index
+
+    @current_player_index.setter
+    def current_player_index(self, value: int) -> None:
+        """Set the current seat index and refresh the cached current player."""
+        self._current_player_index = value
+        self._sync_current_player()
+
+    def _sync_current_player(self) -> None:
+        """Re-derive the cached current player from the seat index."""
+        idx = self._current_player_index
+        if 0 <= idx < len(self.players):
+            player = self.players[idx]
+            self._current_player = player
+            self._current_player_id = player.player_id
+        else:
+            self._current_player = None
+            self._current_player_id = None
+
+    @property
+    def pending_action(self) -> Optional[PendingAction]:
+        """Get the decision the game is waiting on, if any."""
+        return self._pending_action
+
+    @pending_action.setter
+    def pending_action(self, value: Union[PendingAction, dict, None]) -> None:
+        """Set the pending decision; dicts are converted for compatibility."""
+        if isinstance(value, dict):
+            value = _pending_action_from_dict(value)
+        self._pending_action = value
 
     # Convenience properties for backward compatibility with WebSocket handlers
 
@@ -140,9 +307,10 @@ class Game:
     def turn_phase(self) -> str:
         """Get the current turn phase as a string for WebSocket compatibility."""
         # Check pending_action for stock_disposition
-        if self.phase == GamePhase.MERGING and self.pending_action:
-            if self.pending_action.get("type") == "stock_disposition":
-                return "stock_disposition"
+        if self.phase == GamePhase.MERGING and isinstance(
+            self._pending_action, StockDispositionAction
+        ):
+            return "stock_disposition"
         return _PHASE_TO_STRING.get(self.phase, "unknown")
 
     @turn_phase.setter
@@ -176,11 +344,13 @@ class Game:
             raise ValueError("Cannot add players after game has started")
         if len(self.players) >= self.MAX_PLAYERS:
             raise ValueError(f"Maximum {self.MAX_PLAYERS} players allowed")
-        if any(p.player_id == player_id for p in self.players):
+        if player_id in self._players_by_id:
             raise ValueError(f"Player with id {player_id} already exists")
 
         player = Player(player_id, name)
         self.players.append(player)
+        self._players_by_id[player_id] = player
+        self._sync_current_player()
 
         if is_bot:
             self.bots[player_id] = Bot(player, bot_difficulty, rng=self.rng)
@@ -202,12 +372,13 @@ class Game:
         if self.phase != GamePhase.LOBBY:
             raise ValueError("Cannot remove players after game has started")
 
-        for i, player in enumerate(self.players):
-            if player.player_id == player_id:
-                self.players.pop(i)
-                self.bots.pop(player_id, None)
-                return True
-        return False
+        player = self._players_by_id.pop(player_id, None)
+        if player is None:
+            return False
+        self.players.remove(player)
+        self.bots.pop(player_id, None)
+        self._sync_current_player()
+        return True
 
     def start_game(self):
         """Start the game by shuffling tiles and dealing to players.
@@ -239,7 +410,7 @@ class Game:
         Returns:
             Current Player instance
         """
-        return self.players[self.current_player_index]
+        return self._current_player
 
     def get_current_player_id(self) -> Optional[str]:
         """Get the ID of the player whose turn it is.
@@ -250,9 +421,7 @@ class Game:
         Returns:
             Player ID string, or None if no players exist
         """
-        if not self.players:
-            return None
-        return self.players[self.current_player_index].player_id
+        return self._current_player_id
 
     def get_player(self, player_id: str) -> Optional[Player]:
         """Get a player by ID.
@@ -263,16 +432,13 @@ class Game:
         Returns:
             Player instance or None if not found
         """
-        for player in self.players:
-            if player.player_id == player_id:
-                return player
-        return None
+        return self._players_by_id.get(player_id)
 
     def next_turn(self):
         """Advance to the next player's turn."""
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
         self.phase = GamePhase.PLAYING
-        self.pending_action = None
+        self._pending_action = None
 
     def handle_all_tiles_unplayable(self, player: Player) -> Optional[dict]:
         """Handle the case where a player has no playable tiles at turn start.
@@ -297,16 +463,10 @@ class Game:
         if not Rules.are_all_tiles_unplayable(self.board, player.hand, self.hotel):
             return None
 
-        # Record the revealed hand
-        revealed_hand = [str(t) for t in player.hand]
-        removed_tiles = []
-
-        # Remove all unplayable tiles from the game (not back to tile bag)
-        tiles_to_remove = list(player.hand)  # Copy since we're modifying
-        for tile in tiles_to_remove:
-            player.remove_tile(tile)
-            removed_tiles.append(str(tile))
-            # Note: tiles are removed from game, NOT returned to tile_bag
+        # Remove all unplayable tiles from the game (not back to tile bag);
+        # the whole hand is revealed and every tile in it is removed
+        revealed_hand = [str(t) for t in player.clear_hand()]
+        removed_tiles = list(revealed_hand)
 
         # Draw new tiles up to hand limit
         new_tiles = []
@@ -350,7 +510,7 @@ class Game:
         Returns:
             True if player can act
         """
-        current = self.get_current_player()
+        current_id = self._current_player_id
 
         # In most phases, only current player can act
         if self.phase in (
@@ -359,17 +519,15 @@ class Game:
             GamePhase.FOUNDING_CHAIN,
             GamePhase.BUYING_STOCKS,
         ):
-            return player_id == current.player_id
+            return player_id == current_id
 
         # During merging, specific player may need to handle disposition
         if self.phase == GamePhase.MERGING:
-            if (
-                self.pending_action
-                and self.pending_action.get("type") == "stock_disposition"
-            ):
-                return player_id == self.pending_action.get("player_id")
+            pending = self._pending_action
+            if isinstance(pending, StockDispositionAction):
+                return player_id == pending.player_id
             # Otherwise, current player chooses survivor
-            return player_id == current.player_id
+            return player_id == current_id
 
         return False
 
@@ -391,7 +549,7 @@ class Game:
         if not player:
             return PlayTileResult(success=False, error="Player not found")
 
-        if player.player_id != self.get_current_player().player_id:
+        if player_id != self._current_player_id:
             return PlayTileResult(success=False, error="Not your turn")
 
         if not player.has_tile(tile):
@@ -412,7 +570,7 @@ class Game:
             self.phase = GamePhase.BUYING_STOCKS
             return PlayTileResult(
                 success=True,
-                tile=str(tile),
+                tile=tile,
                 result_type="nothing",
                 next_action="buy_stocks",
             )
@@ -424,7 +582,7 @@ class Game:
             self.phase = GamePhase.BUYING_STOCKS
             return PlayTileResult(
                 success=True,
-                tile=str(tile),
+                tile=tile,
                 result_type="expand",
                 chain=chain_name,
                 next_action="buy_stocks",
@@ -434,14 +592,12 @@ class Game:
             # Player needs to choose which chain to found
             available = self.hotel.get_inactive_chains()
             self.phase = GamePhase.FOUNDING_CHAIN
-            self.pending_action = {
-                "type": "found_chain",
-                "tile": tile,
-                "available_chains": available,
-            }
+            self._pending_action = FoundChainAction(
+                tile=tile, available_chains=available
+            )
             return PlayTileResult(
                 success=True,
-                tile=str(tile),
+                tile=tile,
                 result_type="found",
                 available_chains=available,
                 next_action="found_chain",
@@ -461,25 +617,23 @@ class Game:
                 self._start_merger_process(tile, survivor, defunct)
                 return PlayTileResult(
                     success=True,
-                    tile=str(tile),
+                    tile=tile,
                     result_type="merge",
                     survivor=survivor,
                     defunct=defunct,
-                    next_action=self.pending_action.get("type")
-                    if self.pending_action
+                    next_action=self._pending_action.type
+                    if self._pending_action
                     else "buy_stocks",
                 )
             else:
                 # Tie - player must choose
                 self.phase = GamePhase.MERGING
-                self.pending_action = {
-                    "type": "choose_survivor",
-                    "tile": tile,
-                    "tied_chains": survivor,
-                }
+                self._pending_action = ChooseSurvivorAction(
+                    tile=tile, tied_chains=survivor
+                )
                 return PlayTileResult(
                     success=True,
-                    tile=str(tile),
+                    tile=tile,
                     result_type="merge_tie",
                     tied_chains=survivor,
                     next_action="choose_merger_survivor",
@@ -493,11 +647,7 @@ class Game:
         self.board.set_chain(tile, chain_name)
 
         # Also add any adjacent played tiles that aren't in a chain
-        connected = self.board.get_connected_tiles(tile)
-        for t in connected:
-            cell = self.board.get_cell(t.column, t.row)
-            if cell.state == TileState.PLAYED and cell.chain is None:
-                self.board.set_chain(t, chain_name)
+        self.board.assign_chain_to_connected_unassigned(tile, chain_name)
 
     def found_chain(self, player_id: str, chain_name: str) -> FoundChainResult:
         """Found a new hotel chain.
@@ -513,27 +663,30 @@ class Game:
             return FoundChainResult(success=False, error="Not in founding chain phase")
 
         player = self.get_player(player_id)
-        if not player or player.player_id != self.get_current_player().player_id:
+        if not player or player_id != self._current_player_id:
             return FoundChainResult(success=False, error="Not your turn")
 
-        if not self.pending_action or self.pending_action.get("type") != "found_chain":
+        pending = self._pending_action
+        if not isinstance(pending, FoundChainAction):
             return FoundChainResult(success=False, error="No pending chain founding")
 
-        available = self.pending_action.get("available_chains", [])
+        # The name is stored on the board and hotel, so use the canonical object
+        chain_name = Hotel.intern_chain_name(chain_name)
+
+        available = pending.available_chains
         if chain_name not in available:
             return FoundChainResult(
                 success=False, error=f"Chain {chain_name} not available"
             )
 
-        tile = self.pending_action.get("tile")
+        tile = pending.tile
 
         # Found the chain
         self.hotel.activate_chain(chain_name)
 
-        # Assign all connected tiles to the chain
-        connected = self.board.get_connected_tiles(tile)
-        for t in connected:
-            self.board.set_chain(t, chain_name)
+        # Assign all connected tiles to the chain (none are chained yet,
+        # or placing the tile would have expanded or merged instead)
+        self.board.assign_chain_to_connected_unassigned(tile, chain_name)
 
         # Give founder a free stock if available, otherwise cash equivalent
         chain_size = self.board.get_chain_size(chain_name)
@@ -553,7 +706,7 @@ class Game:
             founder_bonus_value = stock_price
 
         self.phase = GamePhase.BUYING_STOCKS
-        self.pending_action = None
+        self._pending_action = None
 
         return FoundChainResult(
             success=True,
@@ -571,8 +724,10 @@ class Game:
         self.phase = GamePhase.MERGING
         self._merger.survivor = survivor
         self._merger.tile = tile  # Store tile for finalization
-        self._merger.defunct_queue = sorted(
-            defunct_chains, key=lambda c: self.board.get_chain_size(c), reverse=True
+        sizes = {c: self.board.get_chain_size(c) for c in defunct_chains}
+        self._merger.defunct_sizes = sizes
+        self._merger.defunct_queue = deque(
+            sorted(defunct_chains, key=sizes.__getitem__, reverse=True)
         )
 
         self._process_next_defunct_chain()
@@ -584,11 +739,11 @@ class Game:
             self._finalize_merger()
             return
 
-        defunct = self._merger.defunct_queue.pop(0)
+        defunct = self._merger.defunct_queue.popleft()
         self._merger.current_defunct = defunct
 
         # Pay bonuses
-        chain_size = self.board.get_chain_size(defunct)
+        chain_size = self._merger.defunct_sizes[defunct]
         bonuses = Rules.calculate_bonuses(self.players, defunct, chain_size, self.hotel)
 
         for player_id, bonus in bonuses.items():
@@ -597,13 +752,13 @@ class Game:
                 total = bonus.get("majority", 0) + bonus.get("minority", 0)
                 player.add_money(total)
         # Find players who need to handle stock disposition
-        stockholders = []
+        # Seat order starting from the current player
         current_idx = self.current_player_index
-        for i in range(len(self.players)):
-            idx = (current_idx + i) % len(self.players)
-            p = self.players[idx]
-            if p.get_stock_count(defunct) > 0:
-                stockholders.append(p.player_id)
+        stockholders = [
+            p.player_id
+            for p in self.players[current_idx:] + self.players[:current_idx]
+            if p.get_stock_count(defunct) > 0
+        ]
 
         if stockholders:
             self._merger.stock_players = stockholders
@@ -625,16 +780,13 @@ class Game:
         defunct = self._merger.current_defunct
         count = player.get_stock_count(defunct)
 
-        self.pending_action = {
-            "type": "stock_disposition",
-            "player_id": player_id,
-            "defunct_chain": defunct,
-            "surviving_chain": self._merger.survivor,
-            "stock_count": count,
-            "available_to_trade": self.hotel.get_available_stocks(
-                self._merger.survivor
-            ),
-        }
+        self._pending_action = StockDispositionAction(
+            player_id=player_id,
+            defunct_chain=defunct,
+            surviving_chain=self._merger.survivor,
+            stock_count=count,
+            available_to_trade=self.hotel.get_available_stocks(self._merger.survivor),
+        )
 
     def choose_merger_survivor(
         self, player_id: str, chain_name: str
@@ -653,29 +805,28 @@ class Game:
                 success=False, error="Not in merging phase"
             )
 
-        if (
-            not self.pending_action
-            or self.pending_action.get("type") != "choose_survivor"
-        ):
+        pending = self._pending_action
+        if not isinstance(pending, ChooseSurvivorAction):
             return ChooseMergerSurvivorResult(
                 success=False, error="No pending survivor choice"
             )
 
         player = self.get_player(player_id)
-        if not player or player.player_id != self.get_current_player().player_id:
+        if not player or player_id != self._current_player_id:
             return ChooseMergerSurvivorResult(success=False, error="Not your turn")
 
-        tied_chains = self.pending_action.get("tied_chains", [])
+        chain_name = Hotel.intern_chain_name(chain_name)
+        tied_chains = pending.tied_chains
         if chain_name not in tied_chains:
             return ChooseMergerSurvivorResult(
                 success=False, error=f"Chain {chain_name} not in tied chains"
             )
 
-        tile = self.pending_action.get("tile")
+        tile = pending.tile
         defunct = [c for c in self._merger.chains if c != chain_name]
 
         self._merger.survivor = chain_name
-        self.pending_action = None
+        self._pending_action = None
 
         self._start_merger_process(tile, chain_name, defunct)
 
@@ -683,8 +834,8 @@ class Game:
             success=True,
             survivor=chain_name,
             defunct=defunct,
-            next_action=self.pending_action.get("type")
-            if self.pending_action
+            next_action=self._pending_action.type
+            if self._pending_action
             else "buy_stocks",
         )
 
@@ -705,23 +856,21 @@ class Game:
         if self.phase != GamePhase.MERGING:
             return StockDispositionResult(success=False, error="Not in merging phase")
 
-        if (
-            not self.pending_action
-            or self.pending_action.get("type") != "stock_disposition"
-        ):
+        pending = self._pending_action
+        if not isinstance(pending, StockDispositionAction):
             return StockDispositionResult(
                 success=False, error="No pending stock disposition"
             )
 
-        if player_id != self.pending_action.get("player_id"):
+        if player_id != pending.player_id:
             return StockDispositionResult(
                 success=False, error="Not your turn to handle stocks"
             )
 
         player = self.get_player(player_id)
-        defunct = self.pending_action.get("defunct_chain")
-        survivor = self.pending_action.get("surviving_chain")
-        total_stock = self.pending_action.get("stock_count")
+        defunct = pending.defunct_chain
+        survivor = pending.surviving_chain
+        total_stock = pending.stock_count
 
         # Validate
         if sell + trade + keep != total_stock:
@@ -743,7 +892,9 @@ class Game:
 
         # Execute sell
         if sell > 0:
-            defunct_size = self.board.get_chain_size(defunct)
+            defunct_size = self._merger.defunct_sizes.get(defunct)
+            if defunct_size is None:
+                defunct_size = self.board.get_chain_size(defunct)
             sell_price = self.hotel.get_stock_price(defunct, defunct_size)
             player.sell_stock(defunct, sell, sell_price)
             self.hotel.return_stock(defunct, sell)
@@ -766,8 +917,8 @@ class Game:
             sold=sell,
             traded=trade,
             kept=keep,
-            next_action=self.pending_action.get("type")
-            if self.pending_action
+            next_action=self._pending_action.type
+            if self._pending_action
             else "buy_stocks",
         )
 
@@ -784,17 +935,13 @@ class Game:
 
         # Absorb the triggering tile and any connected lone tiles
         if tile:
-            connected = self.board.get_connected_tiles(tile)
-            for t in connected:
-                cell = self.board.get_cell(t.column, t.row)
-                if cell.chain is None:
-                    self.board.set_chain(t, survivor)
+            self.board.assign_chain_to_connected_unassigned(tile, survivor)
 
         # Reset merger state
         self._merger.reset()
 
         self.phase = GamePhase.BUYING_STOCKS
-        self.pending_action = None
+        self._pending_action = None
 
     def buy_stocks(self, player_id: str, purchases: list[str]) -> BuyStocksResult:
         """Buy stocks for the current player.
@@ -810,7 +957,7 @@ class Game:
             return BuyStocksResult(success=False, error="Not in buying stocks phase")
 
         player = self.get_player(player_id)
-        if not player or player.player_id != self.get_current_player().player_id:
+        if not player or player_id != self._current_player_id:
             return BuyStocksResult(success=False, error="Not your turn")
 
         if len(purchases) > self.MAX_STOCKS_PER_TURN:
@@ -819,19 +966,26 @@ class Game:
                 error=f"Can only buy up to {self.MAX_STOCKS_PER_TURN} stocks",
             )
 
+        intern = Hotel.intern_chain_name
+        purchases = [intern(chain_name) for chain_name in purchases]
+
         # Validate all purchases first
-        total_cost = 0
         chain_counts = {}
         for chain_name in purchases:
             if not self.hotel.is_chain_active(chain_name):
                 return BuyStocksResult(
                     success=False, error=f"Chain {chain_name} is not active"
                 )
-
             chain_counts[chain_name] = chain_counts.get(chain_name, 0) + 1
-            size = self.board.get_chain_size(chain_name)
-            price = self.hotel.get_stock_price(chain_name, size)
-            total_cost += price
+
+        # Price each distinct chain once; buying doesn't change chain size
+        prices = {
+            chain_name: self.hotel.get_stock_price(
+                chain_name, self.board.get_chain_size(chain_name)
+            )
+            for chain_name in chain_counts
+        }
+        total_cost = sum(prices[c] * count for c, count in chain_counts.items())
 
         if total_cost > player.money:
             return BuyStocksResult(success=False, error="Not enough money")
@@ -845,8 +999,7 @@ class Game:
         # Execute purchases
         bought = []
         for chain_name in purchases:
-            size = self.board.get_chain_size(chain_name)
-            price = self.hotel.get_stock_price(chain_name, size)
+            price = prices[chain_name]
             self.hotel.buy_stock(chain_name)
             player.buy_stock(chain_name, 1, price)
             bought.append(StockPurchase(chain=chain_name, price=price))
@@ -873,25 +1026,24 @@ class Game:
             )
 
         player = self.get_player(player_id)
-        if not player or player.player_id != self.get_current_player().player_id:
+        if not player or player_id != self._current_player_id:
             return EndTurnResult(success=False, error="Not your turn")
 
         # Draw a tile if possible
         drawn_tile = self.draw_tile(player)
 
-        # Replace any permanently unplayable tiles
+        # Replace any permanently unplayable tiles. The board doesn't change
+        # while replacing, so each round is one scan against the same mask.
         replaced = []
         while True:
-            unplayable = [
-                t
-                for t in player.hand
-                if Rules.is_tile_permanently_unplayable(self.board, t, self.hotel)
-            ]
+            unplayable = Rules.get_permanently_unplayable(
+                self.board, player.hand, self.hotel
+            )
             if not unplayable or not self.tile_bag:
                 break
             for tile in unplayable:
                 player.remove_tile(tile)
-                replaced.append(str(tile))
+                replaced.append(tile)
                 self.draw_tile(player)
 
         # Check for end game condition
@@ -902,10 +1054,10 @@ class Game:
 
         return EndTurnResult(
             success=True,
-            drew_tile=str(drawn_tile) if drawn_tile else None,
+            drew_tile=drawn_tile,
             replaced_tiles=replaced,
             can_end_game=can_end,
-            next_player=self.get_current_player().player_id,
+            next_player=self._current_player_id,
         )
 
     def end_game(self) -> EndGameResult:
@@ -920,9 +1072,13 @@ class Game:
         if self.phase == GamePhase.LOBBY:
             return EndGameResult(success=False, error="Game hasn't started")
 
+        # Liquidation price per chain: current price if active, else 0
+        prices = dict.fromkeys(_ALL_CHAIN_NAMES, 0)
+
         # Pay final bonuses for all active chains
         for chain_name in self.hotel.get_active_chains():
             chain_size = self.board.get_chain_size(chain_name)
+            prices[chain_name] = self.hotel.get_stock_price(chain_name, chain_size)
             bonuses = Rules.calculate_bonuses(
                 self.players, chain_name, chain_size, self.hotel
             )
@@ -932,18 +1088,15 @@ class Game:
                     total = bonus.get("majority", 0) + bonus.get("minority", 0)
                     player.add_money(total)
 
-        # Sell all stocks at current prices
+        # Sell all stocks at current prices, one payout per player
         for player in self.players:
-            for chain_name in Hotel.get_all_chain_names():
+            payout = 0
+            for chain_name, price in prices.items():
                 count = player.get_stock_count(chain_name)
                 if count > 0:
-                    if self.hotel.is_chain_active(chain_name):
-                        size = self.board.get_chain_size(chain_name)
-                        price = self.hotel.get_stock_price(chain_name, size)
-                    else:
-                        price = 0
                     player.set_stocks(chain_name, 0)
-                    player.add_money(count * price)
+                    payout += count * price
+            player.add_money(payout)
 
         # Calculate final standings
         standings_data = []
@@ -1059,11 +1212,20 @@ class Game:
         Returns:
             Number of pending trades where this player is the proposer
         """
-        count = 0
-        for trade in self.pending_trades.values():
-            if trade.from_player_id == player_id:
-                count += 1
-        return count
+        return self._pending_trades_by_proposer.get(player_id, 0)
+
+    def _add_pending_trade(self, trade: TradeOffer) -> None:
+        """Store a pending trade and count it against its proposer."""
+        self.pending_trades[trade.trade_id] = trade
+        proposer = trade.from_player_id
+        self._pending_trades_by_proposer[proposer] = (
+            self._pending_trades_by_proposer.get(proposer, 0) + 1
+        )
+
+    def _remove_pending_trade(self, trade_id: str) -> None:
+        """Drop a pending trade and release its proposer's slot."""
+        trade = self.pending_trades.pop(trade_id)
+        self._pending_trades_by_proposer[trade.from_player_id] -= 1
 
     def propose_trade(self, trade: TradeOffer) -> ProposeTradeResult:
         """Propose a trade to another player.
@@ -1098,7 +1260,7 @@ class Game:
             return ProposeTradeResult(success=False, error=error_msg)
 
         # Add to pending trades
-        self.pending_trades[trade.trade_id] = trade
+        self._add_pending_trade(trade)
 
         return ProposeTradeResult(
             success=True,
@@ -1137,7 +1299,7 @@ class Game:
         is_valid, error_msg = Rules.validate_trade(self, trade)
         if not is_valid:
             # Trade is no longer valid, remove it
-            del self.pending_trades[trade_id]
+            self._remove_pending_trade(trade_id)
             return AcceptTradeResult(
                 success=False, error=f"Trade is no longer valid: {error_msg}"
             )
@@ -1158,7 +1320,7 @@ class Game:
         )
 
         # Remove the trade from pending
-        del self.pending_trades[trade_id]
+        self._remove_pending_trade(trade_id)
 
         return AcceptTradeResult(
             success=True,
@@ -1196,7 +1358,7 @@ class Game:
             )
 
         # Remove the trade
-        del self.pending_trades[trade_id]
+        self._remove_pending_trade(trade_id)
 
         return RejectTradeResult(success=True, trade_id=trade_id, rejected_by=player_id)
 
@@ -1225,7 +1387,7 @@ class Game:
             )
 
         # Remove the trade
-        del self.pending_trades[trade_id]
+        self._remove_pending_trade(trade_id)
 
         return CancelTradeResult(success=True, trade_id=trade_id, canceled_by=player_id)
 
@@ -1304,30 +1466,29 @@ class Game:
 
         # Founding chain phase
         if self.phase == GamePhase.FOUNDING_CHAIN:
-            available = self.pending_action.get("available_chains", [])
+            available = self._pending_action.available_chains
             chain = bot.choose_chain_to_found(available, self.board)
             result = self.found_chain(player_id, chain)
             actions.append({"action": "found_chain", **result.to_dict()})
 
         # Merging phase - handle survivor choice if needed
         while self.phase == GamePhase.MERGING:
-            if self.pending_action:
-                action_type = self.pending_action.get("type")
-
-                if action_type == "choose_survivor":
-                    tied = self.pending_action.get("tied_chains", [])
+            pending = self._pending_action
+            if pending:
+                if isinstance(pending, ChooseSurvivorAction):
+                    tied = pending.tied_chains
                     choice = bot.choose_merger_survivor(tied, self.board, self.hotel)
                     result = self.choose_merger_survivor(player_id, choice)
                     actions.append({"action": "choose_survivor", **result.to_dict()})
 
-                elif action_type == "stock_disposition":
+                elif isinstance(pending, StockDispositionAction):
                     # This might be for another player
-                    disposition_player_id = self.pending_action.get("player_id")
+                    disposition_player_id = pending.player_id
                     if disposition_player_id in self.bots:
                         disp_bot = self.bots[disposition_player_id]
-                        defunct = self.pending_action.get("defunct_chain")
-                        survivor = self.pending_action.get("surviving_chain")
-                        count = self.pending_action.get("stock_count")
+                        defunct = pending.defunct_chain
+                        survivor = pending.surviving_chain
+                        count = pending.stock_count
 
                         decision = disp_bot.choose_stock_disposition(
                             defunct, survivor, count, self.board, self.hotel
@@ -1375,10 +1536,7 @@ class Game:
         if self.phase != GamePhase.MERGING:
             return None
 
-        if (
-            not self.pending_action
-            or self.pending_action.get("type") != "stock_disposition"
-        ):
+        if not isinstance(self._pending_action, StockDispositionAction):
             return None
 
         survivor = self._merger.survivor
@@ -1415,6 +1573,59 @@ class Game:
             "disposition_queue": queue,
         }
 
+    def snapshot(self) -> GameSnapshot:
+        """Capture the full mutable game state.
+
+        Much cheaper than copy.deepcopy(game): only the containers that
+        change during play are copied, and tiles and trades are shared.
+
+        Returns:
+            GameSnapshot to pass to restore()
+        """
+        return GameSnapshot(
+            board=self.board.copy(),
+            hotel=self.hotel.get_state(),
+            players=tuple((p.player_id, p.snapshot()) for p in self.players),
+            tile_bag=tuple(self.tile_bag),
+            current_player_index=self._current_player_index,
+            phase=self.phase,
+            pending_action=self._pending_action,
+            merger=self._merger.copy(),
+            pending_trades=tuple(self.pending_trades.values()),
+            rng_state=self.rng.getstate(),
+        )
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """Rewind this game to a snapshot taken from it.
+
+        Players and bots are kept and their state is reset in place, so
+        references held by callers stay valid. The snapshot itself is left
+        untouched and can be restored again.
+
+        Args:
+            snapshot: Value previously returned by snapshot()
+
+        Raises:
+            ValueError: If the snapshot's players don't match this game's
+        """
+        if [pid for pid, _ in snapshot.players] != self.turn_order:
+            raise ValueError("Snapshot was taken from a different set of players")
+
+        self.board = snapshot.board.copy()
+        self.hotel.load_state(snapshot.hotel)
+        for player, (_, state) in zip(self.players, snapshot.players):
+            player.restore(state)
+        self.tile_bag = list(snapshot.tile_bag)
+        self.current_player_index = snapshot.current_player_index
+        self.phase = snapshot.phase
+        self._pending_action = snapshot.pending_action
+        self._merger = snapshot.merger.copy()
+        self.pending_trades = {}
+        self._pending_trades_by_proposer = {}
+        for trade in snapshot.pending_trades:
+            self._add_pending_trade(trade)
+        self.rng.setstate(snapshot.rng_state)
+
     def get_public_state(self) -> dict:
         """Get public game state visible to everyone.
 
@@ -1423,7 +1634,7 @@ class Game:
         """
         # Calculate chain sizes and prices
         chain_info = {}
-        for chain_name in Hotel.get_all_chain_names():
+        for chain_name in _ALL_CHAIN_NAMES:
             size = self.board.get_chain_size(chain_name)
             active = self.hotel.is_chain_active(chain_name)
             price = self.hotel.get_stock_price(chain_name, size) if active else 0
@@ -1456,15 +1667,15 @@ class Game:
         merger_state = self._get_merger_state()
 
         state = {
-            "phase": _PHASE_TO_STRING.get(self.phase, self.phase.value),
-            "current_player": self.get_current_player().player_id
-            if self.players
-            else None,
+            "phase": _PHASE_TO_STRING.get(self.phase, self.phase.label),
+            "current_player": self._current_player_id,
             "board": self.board.get_state(),
             "chains": chain_info,
             "players": player_info,
             "tiles_remaining": len(self.tile_bag),
-            "pending_action": self.pending_action,
+            "pending_action": self._pending_action.to_dict()
+            if self._pending_action
+            else None,
             "can_end_game": Rules.check_end_game(self.board, self.hotel)
             if self.phase != GamePhase.LOBBY
             else False,
@@ -1512,8 +1723,7 @@ class Game:
         # Check if this player can declare end game
         # Only the current player can declare, and only if conditions are met
         end_game_available = (
-            player_id == self.get_current_player().player_id
-            and self.can_declare_end_game()
+            player_id == self._current_player_id and self.can_declare_end_game()
         )
 
         return {
@@ -2,7 +2,10 @@
 
 from enum import Enum
 from dataclasses import dataclass
-from typing import ClassVar
+from typing import ClassVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from game.board import Board
 
 
 class HotelTier(Enum):
@@ -65,16 +68,8 @@ class HotelChain:
         """Get stock price based on chain size."""
         if size < 2:
             return 0
-
-        price_table = self.PRICE_TABLE[self.tier]
-        # Find the appropriate price bracket
-        price = 0
-        for threshold, bracket_price in sorted(price_table.items()):
-            if size >= threshold:
-                price = bracket_price
-            else:
-                break
-        return price
+        prices = _PRICE_BY_SIZE[self.tier]
+        return prices[size] if size < len(prices) else prices[-1]
 
     def get_majority_bonus(self, size: int) -> int:
         """Get majority stockholder bonus (10x stock price)."""
@@ -89,6 +84,22 @@ class HotelChain:
         return size >= self.SAFE_SIZE
 
 
+def _build_price_lookup(price_table: dict[int, int]) -> tuple[int, ...]:
+    """Expand a bracket table into a price for every size up to the top bracket."""
+    prices = []
+    price = 0
+    for size in range(max(price_table) + 1):
+        price = price_table.get(size, price)
+        prices.append(price)
+    return tuple(prices)
+
+
+# Tier -> price indexed by chain size; sizes past the end use the last entry
+_PRICE_BY_SIZE: dict[HotelTier, tuple[int, ...]] = {
+    tier: _build_price_lookup(table) for tier, table in HotelChain.PRICE_TABLE.items()
+}
+
+
 class Hotel:
     """Manages all hotel chains in the game."""
 
@@ -120,6 +131,16 @@ class Hotel:
         """Get a hotel chain by name."""
         return cls.CHAINS[name]
 
+    @classmethod
+    def intern_chain_name(cls, name: str) -> str:
+        """Get the canonical string object for a chain name.
+
+        Names from clients are equal to, but not the same object as, the
+        CHAINS keys. Storing the canonical object lets later dict lookups
+        and comparisons succeed on identity. Unknown names pass through.
+        """
+        return _CANONICAL_CHAIN_NAMES.get(name, name)
+
     @classmethod
     def get_all_chain_names(cls) -> list[str]:
         """Get all chain names."""
@@ -149,6 +170,20 @@ class Hotel:
         """Get number of stocks available to purchase."""
         return self._available_stocks[chain_name]
 
+    def snapshot_active(self, board: "Board") -> dict[str, tuple[int, int, int]]:
+        """Get (available stocks, size, stock price) for each active chain.
+
+        Keys are sorted like get_active_chains().
+        """
+        sizes = board.get_chain_sizes()
+        available = self._available_stocks
+        snapshot = {}
+        for name in sorted(self._active_chains):
+            size = sizes.get(name, 0)
+            price = self.CHAINS[name].get_stock_price(size)
+            snapshot[name] = (available[name], size, price)
+        return snapshot
+
     def buy_stock(self, chain_name: str, quantity: int = 1) -> bool:
         """Remove stocks from available pool. Returns True if successful."""
         if self._available_stocks[chain_name] >= quantity:
@@ -189,3 +224,7 @@ class Hotel:
         """Load state from dict."""
         self._available_stocks = dict(state["available_stocks"])
         self._active_chains = set(state["active_chains"])
+
+
+# Chain name -> the CHAINS key object itself (see Hotel.intern_chain_name)
+_CANONICAL_CHAIN_NAMES: dict[str, str] = {name: name for name in Hotel.CHAINS}
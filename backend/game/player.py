@@ -7,6 +7,8 @@ from game.hotel import Hotel
 class Player:
     """Represents a player in the Acquire game."""
 
+    __slots__ = ("_hand", "_money", "_stocks", "name", "player_id")
+
     STARTING_MONEY = 6000
     MAX_HAND_SIZE = 6
     MAX_STOCKS_PER_CHAIN = 25
@@ -76,6 +78,15 @@ class Player:
         self._hand.remove(tile)
         return True
 
+    def clear_hand(self) -> list[Tile]:
+        """Remove every tile from the player's hand.
+
+        Returns:
+            The removed tiles, in hand order
+        """
+        removed, self._hand = self._hand, []
+        return removed
+
     def has_tile(self, tile: Tile) -> bool:
         """Check if player has a specific tile."""
         return tile in self._hand
@@ -412,5 +423,24 @@ class Player:
         player._stocks = dict(state["stocks"])
         return player
 
+    def snapshot(self) -> tuple[int, tuple[Tile, ...], dict[str, int]]:
+        """Capture money, hand and stocks for a later restore().
+
+        Returns:
+            Opaque (money, hand, stocks) tuple
+        """
+        return self._money, tuple(self._hand), dict(self._stocks)
+
+    def restore(self, snapshot: tuple[int, tuple[Tile, ...], dict[str, int]]):
+        """Reset money, hand and stocks from a snapshot().
+
+        Args:
+            snapshot: Value previously returned by snapshot()
+        """
+        money, hand, stocks = snapshot
+        self._money = money
+        self._hand = list(hand)
+        self._stocks = dict(stocks)
+
     def __repr__(self) -> str:
         return f"Player(id={self.player_id}, name={self.name}, money=${self._money})"
@@ -7,6 +7,8 @@ interfaces for all Game method responses.
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 
+from game.board import Tile
+
 
 @dataclass
 class GameResponse:
@@ -53,7 +55,7 @@ class PlayTileResult(GameResponse):
     """Result of playing a tile.
 
     Attributes:
-        tile: The tile that was played (e.g., "5E")
+        tile: The tile that was played (serialized as e.g. "5E")
         result_type: What happened - "nothing", "expand", "found", "merge", "merge_tie"
         chain: For expand - which chain grew
         available_chains: For found - chains player can choose to found
@@ -63,7 +65,7 @@ class PlayTileResult(GameResponse):
         next_action: What action is needed next
     """
 
-    tile: Optional[str] = None
+    tile: Optional[Tile] = None
     result_type: Optional[str] = (
         None  # "nothing", "expand", "found", "merge", "merge_tie"
     )
@@ -79,7 +81,7 @@ class PlayTileResult(GameResponse):
     def to_dict(self) -> dict:
         d = super().to_dict()
         if self.tile:
-            d["tile"] = self.tile
+            d["tile"] = str(self.tile)
         if self.result_type:
             d["result"] = self.result_type
         if self.chain:
@@ -247,16 +249,16 @@ class EndTurnResult(GameResponse):
         next_player: ID of the next player
     """
 
-    drew_tile: Optional[str] = None
-    replaced_tiles: List[str] = field(default_factory=list)
+    drew_tile: Optional[Tile] = None
+    replaced_tiles: List[Tile] = field(default_factory=list)
     can_end_game: bool = False
     next_player: Optional[str] = None
 
     def to_dict(self) -> dict:
         d = super().to_dict()
         if self.success:
-            d["drew_tile"] = self.drew_tile
-            d["replaced_tiles"] = self.replaced_tiles
+            d["drew_tile"] = str(self.drew_tile) if self.drew_tile else None
+            d["replaced_tiles"] = [str(t) for t in self.replaced_tiles]
             d["can_end_game"] = self.can_end_game
             d["next_player"] = self.next_player
         return d
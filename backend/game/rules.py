@@ -1,9 +1,18 @@
 """Game rules and validation logic for Acquire."""
 
+from collections.abc import Iterator, Sequence
 from enum import Enum
-from typing import Union, List, Tuple, TYPE_CHECKING
+from typing import (
+    NamedTuple,
+    Optional,
+    Union,
+    List,
+    Tuple,
+    TYPE_CHECKING,
+)
 from game.board import Board, Tile, TileState
 from game.hotel import Hotel
+from game.player import Player
 from game.action import TradeOffer
 
 if TYPE_CHECKING:
@@ -18,26 +27,24 @@ class UnplayableReason(Enum):
     EIGHTH_CHAIN = "would_create_eighth_chain"
 
 
-class PlacementResult:
-    """Result of analyzing a tile placement."""
+class PlacementResult(NamedTuple):
+    """Result of analyzing a tile placement.
+
+    Attributes:
+        result_type: One of NOTHING, EXPAND, FOUND, MERGE
+        chain: For EXPAND, the chain being expanded
+        chains: For MERGE, list of chains involved (empty otherwise)
+    """
+
+    result_type: str
+    chain: Optional[str] = None
+    chains: Sequence[str] = ()
 
     NOTHING = "nothing"
     EXPAND = "expand"
     FOUND = "found"
     MERGE = "merge"
 
-    def __init__(self, result_type: str, chain: str = None, chains: list[str] = None):
-        """Initialize placement result.
-
-        Args:
-            result_type: One of NOTHING, EXPAND, FOUND, MERGE
-            chain: For EXPAND, the chain being expanded
-            chains: For MERGE, list of chains involved
-        """
-        self.result_type = result_type
-        self.chain = chain
-        self.chains = chains or []
-
     def __repr__(self):
         if self.result_type == self.EXPAND:
             return f"PlacementResult({self.result_type}, chain={self.chain})"
@@ -46,6 +53,39 @@ class PlacementResult:
         return f"PlacementResult({self.result_type})"
 
 
+# Results without a payload are immutable, so every placement shares them
+_NOTHING_RESULT = PlacementResult(PlacementResult.NOTHING)
+_FOUND_RESULT = PlacementResult(PlacementResult.FOUND)
+
+
+def _disposition_combinations(
+    defunct_count: int, available_to_trade: int
+) -> tuple[tuple[int, int, int], ...]:
+    """Build the splits returned by Rules.get_valid_disposition_combinations."""
+    # Trade must be even (2:1 ratio) and limited by available survivor stock;
+    # keep takes whatever is left, so it is never negative
+    trade_cap = available_to_trade * 2
+    return tuple(
+        (sell, trade, defunct_count - sell - trade)
+        for sell in range(defunct_count + 1)
+        for trade in range(0, min(defunct_count - sell, trade_cap) + 1, 2)
+    )
+
+
+def _disposition_key(defunct_count: int, available_to_trade: int) -> tuple[int, int]:
+    """Clamp survivor availability to where it stops limiting trades."""
+    return defunct_count, min(available_to_trade, (defunct_count + 1) // 2)
+
+
+# No player can hold more than 25 shares of a chain, so every split a game
+# can ask for is built once at import, keyed by _disposition_key
+_DISPOSITION_TABLE: dict[tuple[int, int], tuple[tuple[int, int, int], ...]] = {
+    (count, tradeable): _disposition_combinations(count, tradeable)
+    for count in range(26)
+    for tradeable in range((count + 1) // 2 + 1)
+}
+
+
 class Rules:
     """Game rules and validation for Acquire."""
 
@@ -66,19 +106,6 @@ class Rules:
         """
         return sum(1 for c in chains if board.get_chain_size(c) >= cls.SAFE_SIZE)
 
-    @classmethod
-    def _are_all_chains_safe(cls, board: Board, chains: list[str]) -> bool:
-        """Check if all chains in the list are safe (11+ tiles).
-
-        Args:
-            board: The game board
-            chains: List of chain names to check
-
-        Returns:
-            True if all chains are safe
-        """
-        return all(board.get_chain_size(c) >= cls.SAFE_SIZE for c in chains)
-
     @classmethod
     def can_place_tile(cls, board: Board, tile: Tile, hotel: Hotel = None) -> bool:
         """Check if tile placement is valid.
@@ -97,12 +124,11 @@ class Rules:
             True if the tile can be placed, False otherwise
         """
         # Check if cell is already occupied
-        cell = board.get_cell(tile.column, tile.row)
-        if cell.state != TileState.EMPTY:
+        if board.is_tile_played(tile):
             return False
 
         # Get adjacent chains
-        adjacent_chains = board.get_adjacent_chains(tile)
+        adjacent_chains, adjacent_played = board.get_adjacency(tile)
 
         # Check for safe chain merger
         if len(adjacent_chains) >= 2:
@@ -112,14 +138,12 @@ class Rules:
 
         # Check if this would create an 8th chain
         if hotel is not None:
-            if len(adjacent_chains) == 0:
-                # Check if this would found a new chain
-                adjacent_played = board.get_adjacent_played_tiles(tile)
-                if len(adjacent_played) > 0:
-                    # This would create a new chain
-                    if len(hotel.get_active_chains()) >= cls.MAX_CHAINS:
-                        # All 7 chains are active, can't create new one
-                        return False
+            # Check if this would found a new chain
+            if len(adjacent_chains) == 0 and adjacent_played > 0:
+                # This would create a new chain
+                if len(hotel.get_active_chains()) >= cls.MAX_CHAINS:
+                    # All 7 chains are active, can't create new one
+                    return False
 
         return True
 
@@ -134,16 +158,15 @@ class Rules:
         Returns:
             PlacementResult indicating the outcome
         """
-        adjacent_chains = board.get_adjacent_chains(tile)
-        adjacent_played = board.get_adjacent_played_tiles(tile)
+        adjacent_chains, adjacent_played = board.get_adjacency(tile)
 
         if len(adjacent_chains) == 0:
-            if len(adjacent_played) == 0:
+            if adjacent_played == 0:
                 # No adjacent tiles at all - isolated tile
-                return PlacementResult(PlacementResult.NOTHING)
+                return _NOTHING_RESULT
             else:
                 # Adjacent to played tiles but no chains - founding a chain
-                return PlacementResult(PlacementResult.FOUND)
+                return _FOUND_RESULT
 
         elif len(adjacent_chains) == 1:
             # Expanding an existing chain
@@ -152,7 +175,7 @@ class Rules:
 
         else:
             # Multiple chains - merger
-            return PlacementResult(PlacementResult.MERGE, chains=adjacent_chains)
+            return PlacementResult(PlacementResult.MERGE, chains=list(adjacent_chains))
 
     @classmethod
     def get_merger_survivor(
@@ -180,14 +203,20 @@ class Rules:
             return []
 
         # Get sizes for all chains
-        chain_sizes = {}
-        for chain_name in chains:
-            chain_sizes[chain_name] = board.get_chain_size(chain_name)
+        sizes = board.get_chain_sizes()
 
-        # Check for safe chains - a safe chain always survives
-        safe_chains = [
-            name for name, size in chain_sizes.items() if size >= cls.SAFE_SIZE
-        ]
+        # One pass: collect safe chains and the chains tied for largest
+        safe_chains = []
+        largest_chains = []
+        max_size = -1
+        for chain_name in chains:
+            size = sizes.get(chain_name, 0)
+            if size >= cls.SAFE_SIZE:
+                safe_chains.append(chain_name)
+            if size > max_size:
+                max_size, largest_chains = size, [chain_name]
+            elif size == max_size:
+                largest_chains.append(chain_name)
 
         # If exactly one chain is safe, it survives regardless of size
         if len(safe_chains) == 1:
@@ -196,14 +225,6 @@ class Rules:
         # Note: len(safe_chains) >= 2 should not happen (illegal merger)
         # But if it does, fall through to size comparison
 
-        # Find the maximum size
-        max_size = max(chain_sizes.values())
-
-        # Find all chains with the maximum size
-        largest_chains = [
-            name for name, size in chain_sizes.items() if size == max_size
-        ]
-
         if len(largest_chains) == 1:
             return largest_chains[0]
         else:
@@ -231,75 +252,65 @@ class Rules:
         Returns:
             Dict mapping player_id to dict with 'majority' and 'minority' bonus amounts
         """
-        # Get stockholders and their share counts
-        stockholders = []
+        # One pass over players, tracking the top two share counts and who
+        # holds them (holders stay in seat order)
+        max_shares = second_shares = 0
+        majority_holders: list[str] = []
+        minority_holders: list[str] = []
         for player in players:
             shares = player.get_stock_count(chain_name)
-            if shares > 0:
-                stockholders.append((player.player_id, shares))
-
-        if not stockholders:
+            if shares <= 0:
+                continue
+            if shares > max_shares:
+                second_shares, minority_holders = max_shares, majority_holders
+                max_shares, majority_holders = shares, [player.player_id]
+            elif shares == max_shares:
+                majority_holders.append(player.player_id)
+            elif shares > second_shares:
+                second_shares, minority_holders = shares, [player.player_id]
+            elif shares == second_shares:
+                minority_holders.append(player.player_id)
+
+        if not majority_holders:
             return {}
 
-        # Sort by share count descending
-        stockholders.sort(key=lambda x: x[1], reverse=True)
-
         # Get bonus amounts
         majority_bonus = hotel.get_majority_bonus(chain_name, chain_size)
         minority_bonus = hotel.get_minority_bonus(chain_name, chain_size)
 
-        bonuses = {}
-
-        if len(stockholders) == 1:
-            # Single stockholder gets both bonuses
-            player_id = stockholders[0][0]
-            bonuses[player_id] = {
-                "majority": majority_bonus,
-                "minority": minority_bonus,
-            }
-            return bonuses
-
-        # Find majority holders (highest share count)
-        max_shares = stockholders[0][1]
-        majority_holders = [pid for pid, shares in stockholders if shares == max_shares]
-
         if len(majority_holders) > 1:
             # Tie for majority - split majority + minority among them
             total_bonus = majority_bonus + minority_bonus
-            split_bonus = cls._round_up_to_hundred(total_bonus / len(majority_holders))
-
-            for player_id in majority_holders:
-                bonuses[player_id] = {"majority": split_bonus, "minority": 0}
-            return bonuses
+            split_bonus = cls._split_bonus(total_bonus, len(majority_holders))
+            return {
+                player_id: {"majority": split_bonus, "minority": 0}
+                for player_id in majority_holders
+            }
 
-        # Single majority holder
         majority_holder = majority_holders[0]
-        bonuses[majority_holder] = {"majority": majority_bonus, "minority": 0}
-
-        # Find minority holders (second highest share count)
-        remaining = [
-            (pid, shares) for pid, shares in stockholders if pid != majority_holder
-        ]
-
-        if remaining:
-            second_max = remaining[0][1]
-            minority_holders = [
-                pid for pid, shares in remaining if shares == second_max
-            ]
-
-            if len(minority_holders) > 1:
-                # Tie for minority - split minority bonus
-                split_bonus = cls._round_up_to_hundred(
-                    minority_bonus / len(minority_holders)
-                )
-                for player_id in minority_holders:
-                    bonuses[player_id] = {"majority": 0, "minority": split_bonus}
-            else:
-                # Single minority holder
-                bonuses[minority_holders[0]] = {
-                    "majority": 0,
+        if not minority_holders:
+            # Single stockholder gets both bonuses
+            return {
+                majority_holder: {
+                    "majority": majority_bonus,
                     "minority": minority_bonus,
                 }
+            }
+
+        # Single majority holder
+        bonuses = {majority_holder: {"majority": majority_bonus, "minority": 0}}
+
+        if len(minority_holders) > 1:
+            # Tie for minority - split minority bonus
+            split_bonus = cls._split_bonus(minority_bonus, len(minority_holders))
+            for player_id in minority_holders:
+                bonuses[player_id] = {"majority": 0, "minority": split_bonus}
+        else:
+            # Single minority holder
+            bonuses[minority_holders[0]] = {
+                "majority": 0,
+                "minority": minority_bonus,
+            }
 
         return bonuses
 
@@ -313,9 +324,23 @@ class Rules:
         Returns:
             Amount rounded up to nearest 100
         """
-        import math
+        return int(-(-amount // 100) * 100)
+
+    @staticmethod
+    def _split_bonus(total: int, holders: int) -> int:
+        """Split a bonus evenly among tied holders, rounding up to $100.
+
+        Equivalent to _round_up_to_hundred(total / holders) but stays in
+        integer arithmetic, so there is no float division or rounding.
+
+        Args:
+            total: The whole bonus being split
+            holders: Number of tied holders (at least 1)
 
-        return int(math.ceil(amount / 100) * 100)
+        Returns:
+            Each holder's share rounded up to nearest 100
+        """
+        return -(-total // (holders * 100)) * 100
 
     @classmethod
     def check_end_game(cls, board: Board, hotel: Hotel) -> bool:
@@ -338,14 +363,16 @@ class Rules:
         if not active_chains:
             return False
 
+        sizes = board.get_chain_sizes()
+        active_sizes = [sizes.get(chain_name, 0) for chain_name in active_chains]
+
         # Check if any chain >= 41 tiles
-        for chain_name in active_chains:
-            if board.get_chain_size(chain_name) >= cls.END_GAME_SIZE:
-                return True
+        if max(active_sizes) >= cls.END_GAME_SIZE:
+            return True
 
         # Check if all active chains are safe (11+ tiles)
         # Note: If all chains are safe, mergers are impossible, so game can end
-        return cls._are_all_chains_safe(board, active_chains)
+        return min(active_sizes) >= cls.SAFE_SIZE
 
     @classmethod
     def is_tile_permanently_unplayable(
@@ -363,18 +390,67 @@ class Rules:
         Returns:
             True if the tile can never be played
         """
-        # Check if already played
-        if board.is_tile_played(tile):
-            return False  # Already played, not unplayable
+        # The board keeps a memoized mask of such cells (played cells are
+        # never in it)
+        return board.would_merge_safe_chains(tile, cls.SAFE_SIZE)
 
-        # Get adjacent chains
-        adjacent_chains = board.get_adjacent_chains(tile)
+    @classmethod
+    def get_permanently_unplayable(
+        cls, board: Board, tiles: list[Tile], hotel: Hotel
+    ) -> list[Tile]:
+        """Get the tiles that can never be legally played.
 
-        if len(adjacent_chains) < 2:
-            return False  # Can't merge if fewer than 2 adjacent chains
+        Equivalent to filtering with is_tile_permanently_unplayable(), but
+        the safe-merge mask is looked up once for the whole list.
 
-        # Permanently unplayable if would merge 2+ safe chains
-        return cls._count_safe_chains(board, adjacent_chains) >= 2
+        Args:
+            board: The game board
+            tiles: List of tiles to check (e.g., player's hand)
+            hotel: Hotel manager
+
+        Returns:
+            List of permanently unplayable tiles, in input order
+        """
+        blocked = board.get_safe_merge_mask(cls.SAFE_SIZE)
+        cell_bit = board.cell_bit
+        return [tile for tile in tiles if blocked & cell_bit(tile)]
+
+    @classmethod
+    def _unplayable_mask(cls, board: Board, hotel: Optional[Hotel]) -> int:
+        """Bitboard of every cell where can_place_tile() would say no.
+
+        Args:
+            board: The game board
+            hotel: Hotel manager (optional, for checking chain count)
+
+        Returns:
+            Board bitboard (see Board.cell_bit) of unplayable cells
+        """
+        can_found = hotel is None or len(hotel.get_active_chains()) < cls.MAX_CHAINS
+        return board.get_unplayable_mask(cls.SAFE_SIZE, can_found)
+
+    @classmethod
+    def iter_playable_tiles(
+        cls, board: Board, tiles: list[Tile], hotel: Hotel
+    ) -> Iterator[Tile]:
+        """Lazily yield the tiles that can legally be played.
+
+        Use this over get_playable_tiles() when only the first playable tile
+        (or whether there is one) matters.
+
+        Args:
+            board: The game board
+            tiles: List of tiles to check (e.g., player's hand)
+            hotel: Hotel manager
+
+        Yields:
+            Each tile that can be legally played, in input order
+        """
+        blocked = cls._unplayable_mask(board, hotel)
+        cell_bit = board.cell_bit
+        for tile in tiles:
+            if not blocked & cell_bit(tile):
+                yield tile
 
     @classmethod
     def get_playable_tiles(
@@ -390,7 +466,7 @@ class Rules:
         Returns:
             List of tiles that can be legally played
         """
-        return [tile for tile in tiles if cls.can_place_tile(board, tile, hotel)]
+        return list(cls.iter_playable_tiles(board, tiles, hotel))
 
     @classmethod
     def get_unplayable_tiles(
@@ -406,7 +482,9 @@ class Rules:
         Returns:
             List of tiles that cannot be legally played
         """
-        return [tile for tile in tiles if not cls.can_place_tile(board, tile, hotel)]
+        blocked = cls._unplayable_mask(board, hotel)
+        cell_bit = board.cell_bit
+        return [tile for tile in tiles if blocked & cell_bit(tile)]
 
     @classmethod
     def are_all_tiles_unplayable(
@@ -429,10 +507,7 @@ class Rules:
         if not tiles:
             return False  # Empty hand is not "all unplayable"
 
-        for tile in tiles:
-            if cls.can_place_tile(board, tile, hotel):
-                return False
-        return True
+        return not any(cls.iter_playable_tiles(board, tiles, hotel))
 
     @classmethod
     def get_tile_playability(cls, board: Board, tile: Tile, hotel: Hotel) -> dict:
@@ -462,7 +537,7 @@ class Rules:
             }
 
         # Get adjacent chains
-        adjacent_chains = board.get_adjacent_chains(tile)
+        adjacent_chains, adjacent_played = board.get_adjacency(tile)
 
         # Determine if this tile would trigger a merger (2+ adjacent chains)
         would_trigger_merger = len(adjacent_chains) >= 2
@@ -478,18 +553,16 @@ class Rules:
                 }
 
         # Check if this would create an 8th chain
-        if len(adjacent_chains) == 0:
-            adjacent_played = board.get_adjacent_played_tiles(tile)
-            if len(adjacent_played) > 0:
-                # This would create a new chain
-                active_chains = hotel.get_active_chains()
-                if len(active_chains) >= cls.MAX_CHAINS:
-                    return {
-                        "playable": False,
-                        "reason": UnplayableReason.EIGHTH_CHAIN.value,
-                        "permanent": True,  # Can never be played while all 7 chains exist
-                        "would_trigger_merger": False,
-                    }
+        if len(adjacent_chains) == 0 and adjacent_played > 0:
+            # This would create a new chain
+            active_chains = hotel.get_active_chains()
+            if len(active_chains) >= cls.MAX_CHAINS:
+                return {
+                    "playable": False,
+                    "reason": UnplayableReason.EIGHTH_CHAIN.value,
+                    "permanent": True,  # Can never be played while all 7 chains exist
+                    "would_trigger_merger": False,
+                }
 
         return {
             "playable": True,
@@ -538,7 +611,7 @@ class Rules:
     @classmethod
     def get_valid_disposition_combinations(
         cls, defunct_count: int, available_to_trade: int = 25
-    ) -> List[Tuple[int, int, int]]:
+    ) -> tuple[tuple[int, int, int], ...]:
         """Generate all valid sell/trade/keep splits for defunct stock.
 
         In Acquire, when a chain is acquired in a merger, stockholders must
@@ -552,21 +625,15 @@ class Rules:
             available_to_trade: Maximum survivor stocks available for trade (default 25)
 
         Returns:
-            List of (sell, trade, keep) tuples representing all valid combinations.
-            Trade values are always even (2:1 exchange ratio).
+            Tuple of (sell, trade, keep) tuples representing all valid
+            combinations. Trade values are always even (2:1 exchange ratio).
+            The result is a shared precomputed table entry, hence immutable.
         """
-        combinations = []
-
-        for sell in range(defunct_count + 1):
-            remaining = defunct_count - sell
-            # Trade must be even (2:1 ratio) and limited by available survivor stock
-            max_trade = min(remaining, available_to_trade * 2)
-            for trade in range(0, max_trade + 1, 2):
-                keep = remaining - trade
-                if keep >= 0:
-                    combinations.append((sell, trade, keep))
-
-        return combinations
+        key = _disposition_key(defunct_count, available_to_trade)
+        combos = _DISPOSITION_TABLE.get(key)
+        if combos is None:
+            combos = _disposition_combinations(*key)
+        return combos
 
     @classmethod
     def validate_trade(cls, game: "Game", trade: TradeOffer) -> Tuple[bool, str]:
@@ -607,46 +674,32 @@ class Rules:
         if trade.requesting_money < 0:
             return False, "Requesting money cannot be negative"
 
+        # Non-negative quantities, noting whether each side gives anything
+        has_offering = trade.offering_money > 0
         for chain_name, quantity in trade.offering_stocks.items():
             if quantity < 0:
                 return (
                     False,
                     f"Offering stock quantity for {chain_name} cannot be negative",
                 )
+            if quantity > 0:
+                has_offering = True
 
+        has_requesting = trade.requesting_money > 0
         for chain_name, quantity in trade.requesting_stocks.items():
             if quantity < 0:
                 return (
                     False,
                     f"Requesting stock quantity for {chain_name} cannot be negative",
                 )
+            if quantity > 0:
+                has_requesting = True
 
         # Check that the trade is not empty
-        has_offering = trade.offering_money > 0 or any(
-            qty > 0 for qty in trade.offering_stocks.values()
-        )
-        has_requesting = trade.requesting_money > 0 or any(
-            qty > 0 for qty in trade.requesting_stocks.values()
-        )
-
         if not has_offering and not has_requesting:
             return False, "Trade must include at least one item to exchange"
 
-        # Check that offering player has the resources they're offering
-        if not from_player.can_afford_trade(
-            trade.offering_stocks, trade.offering_money
-        ):
-            return False, "Offering player does not have the required stocks or money"
-
-        # Check that receiving player has the resources being requested
-        if not to_player.can_afford_trade(
-            trade.requesting_stocks, trade.requesting_money
-        ):
-            return False, "Receiving player does not have the requested stocks or money"
-
         # Check that receiving stocks won't exceed max for the receiver
-        from game.player import Player
-
         for chain_name, quantity in trade.offering_stocks.items():
             if quantity > 0:
                 current = to_player.get_stock_count(chain_name)
@@ -666,4 +719,16 @@ class Rules:
                         f"Trade would exceed max stocks for {chain_name} for offering player",
                     )
 
+        # Check that offering player has the resources they're offering
+        if not from_player.can_afford_trade(
+            trade.offering_stocks, trade.offering_money
+        ):
+            return False, "Offering player does not have the required stocks or money"
+
+        # Check that receiving player has the resources being requested
+        if not to_player.can_afford_trade(
+            trade.requesting_stocks, trade.requesting_money
+        ):
+            return False, "Receiving player does not have the requested stocks or money"
+
         return True, ""
@@ -1,10 +1,13 @@
 """FastAPI application for Acquire board game."""
 
+import asyncio
 import json
 import os
 import re
 import uuid
-from typing import Optional, Union, Literal
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any, Optional, Union, Literal
 
 from fastapi import (
     FastAPI,
@@ -15,9 +18,9 @@ from fastapi import (
 )
 from pydantic import BaseModel, field_validator, ValidationError
 
-from session.manager import SessionManager
+from session.manager import SessionManager, encode_message, extend_encoded
 from game.board import Tile
-from game.game import Game, GamePhase
+from game.game import Game, GamePhase, StockDispositionAction
 from game.action import TradeOffer
 
 
@@ -224,6 +227,22 @@ WebSocketMessage = Union[
 ]
 
 
+# Action name -> message model that validates it
+_MESSAGE_TYPES: dict[str, type[BaseModel]] = {
+    "place_tile": PlaceTileMessage,
+    "found_chain": FoundChainMessage,
+    "merger_choice": MergerChoiceMessage,
+    "merger_disposition": MergerDispositionMessage,
+    "buy_stocks": BuyStocksMessage,
+    "end_turn": EndTurnMessage,
+    "declare_end_game": DeclareEndGameMessage,
+    "propose_trade": ProposeTradeMessage,
+    "accept_trade": AcceptTradeMessage,
+    "reject_trade": RejectTradeMessage,
+    "cancel_trade": CancelTradeMessage,
+}
+
+
 def validate_websocket_message(
     data: dict,
 ) -> tuple[Optional[WebSocketMessage], Optional[str]]:
@@ -239,25 +258,11 @@ def validate_websocket_message(
     """
     action = data.get("action")
 
-    message_types = {
-        "place_tile": PlaceTileMessage,
-        "found_chain": FoundChainMessage,
-        "merger_choice": MergerChoiceMessage,
-        "merger_disposition": MergerDispositionMessage,
-        "buy_stocks": BuyStocksMessage,
-        "end_turn": EndTurnMessage,
-        "declare_end_game": DeclareEndGameMessage,
-        "propose_trade": ProposeTradeMessage,
-        "accept_trade": AcceptTradeMessage,
-        "reject_trade": RejectTradeMessage,
-        "cancel_trade": CancelTradeMessage,
-    }
-
-    if action not in message_types:
+    if action not in _MESSAGE_TYPES:
         return None, f"Unknown action: {action}"
 
     try:
-        validated = message_types[action](**data)
+        validated = _MESSAGE_TYPES[action](**data)
         return validated, None
     except ValidationError as e:
         # Extract first error message
@@ -267,7 +272,44 @@ def validate_websocket_message(
         return None, "Validation error"
 
 
-app = FastAPI(title="Acquire Board Game")
+# Lobby rooms left with nobody connected are dropped after this long
+STALE_ROOM_SECONDS = 30 * 60
+ROOM_SWEEP_INTERVAL_SECONDS = 60
+
+
+async def sweep_stale_rooms_forever():
+    """Periodically delete abandoned lobby rooms so they don't pile up."""
+    while True:
+        await asyncio.sleep(ROOM_SWEEP_INTERVAL_SECONDS)
+        session_manager.sweep_stale_rooms(STALE_ROOM_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the stale-room sweep for the lifetime of the server."""
+    sweeper = asyncio.create_task(sweep_stale_rooms_forever())
+    try:
+        yield
+    finally:
+        sweeper.cancel()
+
+
+app = FastAPI(title="Acquire Board Game", lifespan=lifespan)
+
+# Fixed player messages, built once and shared by every send; treat as
+# read-only
+_ERR_NOT_YOUR_TURN = {"type": "error", "message": "Not your turn"}
+_ERR_NOT_PLAYING_PHASE = {"type": "error", "message": "Not in playing phase"}
+_ERR_INVALID_TILE = {"type": "error", "message": "Invalid tile"}
+_ERR_TRADE_NOT_FOUND = {"type": "error", "message": "Trade not found"}
+_ERR_TILES_REPLACED = {
+    "type": "error",
+    "message": "Your tiles were replaced. Please select a new tile to play.",
+}
+_MSG_CAN_END_GAME = {
+    "type": "can_end_game",
+    "message": "You may choose to end the game",
+}
 
 # Global session manager
 session_manager = SessionManager()
@@ -504,6 +546,8 @@ async def host_websocket(websocket: WebSocket, room_code: str):
     # Send current state
     await send_host_state(room_code)
 
+    # Reuse the room fetched above for every message. If it is deleted in
+    # the meantime it has no players, and end_game() re-checks the code.
     try:
         while True:
             data = await websocket.receive_json()
@@ -515,19 +559,19 @@ async def host_websocket(websocket: WebSocket, room_code: str):
                     await broadcast_lobby_update(room_code)
 
             elif action == "start_game":
-                room = session_manager.get_room(room_code)
-                if room and not room.started and len(room.players) >= room.min_players:
+                if not room.started and len(room.players) >= room.min_players:
                     session_manager.start_game(room_code)
                     await initialize_game(room_code)
                     await broadcast_game_state(room_code)
 
             elif action == "end_game":
-                room = session_manager.get_room(room_code)
-                if room and room.started:
+                if room.started:
                     await end_game(room_code)
 
     except WebSocketDisconnect:
         pass
+    finally:
+        session_manager.disconnect_host(room_code, websocket)
 
 
 @app.websocket("/ws/player/{room_code}/{player_id}")
@@ -582,6 +626,42 @@ async def player_websocket(websocket: WebSocket, room_code: str, player_id: str)
         session_manager.disconnect(room_code, player_id, websocket)
 
 
+# Validated action name -> coroutine taking (room_code, player_id, message).
+# Handlers are resolved by name when called, so they can still be patched.
+_ACTION_HANDLERS: dict[str, Callable[[str, str, Any], Awaitable[None]]] = {
+    "place_tile": lambda rc, pid, msg: handle_place_tile(rc, pid, msg.tile),
+    "found_chain": lambda rc, pid, msg: handle_found_chain(rc, pid, msg.chain),
+    "merger_choice": lambda rc, pid, msg: handle_merger_choice(
+        rc, pid, msg.surviving_chain
+    ),
+    "merger_disposition": lambda rc, pid, msg: handle_merger_disposition(
+        rc,
+        pid,
+        msg.defunct_chain,
+        {
+            "sell": msg.disposition.sell,
+            "trade": msg.disposition.trade,
+            "hold": msg.disposition.hold,
+        },
+    ),
+    "buy_stocks": lambda rc, pid, msg: handle_buy_stocks(rc, pid, msg.purchases),
+    "end_turn": lambda rc, pid, msg: handle_end_turn(rc, pid),
+    "declare_end_game": lambda rc, pid, msg: handle_declare_end_game(rc, pid),
+    "propose_trade": lambda rc, pid, msg: handle_propose_trade(
+        rc,
+        pid,
+        msg.to_player_id,
+        msg.offering_stocks,
+        msg.offering_money,
+        msg.requesting_stocks,
+        msg.requesting_money,
+    ),
+    "accept_trade": lambda rc, pid, msg: handle_accept_trade(rc, pid, msg.trade_id),
+    "reject_trade": lambda rc, pid, msg: handle_reject_trade(rc, pid, msg.trade_id),
+    "cancel_trade": lambda rc, pid, msg: handle_cancel_trade(rc, pid, msg.trade_id),
+}
+
+
 async def handle_player_action(room_code: str, player_id: str, data: dict) -> None:
     """Process player actions and broadcast updates.
 
@@ -602,64 +682,7 @@ async def handle_player_action(room_code: str, player_id: str, data: dict) -> No
         )
         return
 
-    action = data.get("action")
-
-    if action == "place_tile":
-        # validated_msg is PlaceTileMessage, tile is already validated and normalized
-        await handle_place_tile(room_code, player_id, validated_msg.tile)
-
-    elif action == "found_chain":
-        # validated_msg is FoundChainMessage, chain is already validated
-        await handle_found_chain(room_code, player_id, validated_msg.chain)
-
-    elif action == "merger_choice":
-        # validated_msg is MergerChoiceMessage
-        await handle_merger_choice(room_code, player_id, validated_msg.surviving_chain)
-
-    elif action == "merger_disposition":
-        # validated_msg is MergerDispositionMessage
-        disposition = {
-            "sell": validated_msg.disposition.sell,
-            "trade": validated_msg.disposition.trade,
-            "hold": validated_msg.disposition.hold,
-        }
-        await handle_merger_disposition(
-            room_code, player_id, validated_msg.defunct_chain, disposition
-        )
-
-    elif action == "buy_stocks":
-        # validated_msg is BuyStocksMessage
-        await handle_buy_stocks(room_code, player_id, validated_msg.purchases)
-
-    elif action == "end_turn":
-        await handle_end_turn(room_code, player_id)
-
-    elif action == "declare_end_game":
-        await handle_declare_end_game(room_code, player_id)
-
-    elif action == "propose_trade":
-        # validated_msg is ProposeTradeMessage
-        await handle_propose_trade(
-            room_code,
-            player_id,
-            validated_msg.to_player_id,
-            validated_msg.offering_stocks,
-            validated_msg.offering_money,
-            validated_msg.requesting_stocks,
-            validated_msg.requesting_money,
-        )
-
-    elif action == "accept_trade":
-        # validated_msg is AcceptTradeMessage
-        await handle_accept_trade(room_code, player_id, validated_msg.trade_id)
-
-    elif action == "reject_trade":
-        # validated_msg is RejectTradeMessage
-        await handle_reject_trade(room_code, player_id, validated_msg.trade_id)
-
-    elif action == "cancel_trade":
-        # validated_msg is CancelTradeMessage
-        await handle_cancel_trade(room_code, player_id, validated_msg.trade_id)
+    await _ACTION_HANDLERS[validated_msg.action](room_code, player_id, validated_msg)
 
 
 async def initialize_game(room_code: str):
@@ -697,15 +720,13 @@ async def handle_place_tile(room_code: str, player_id: str, tile_str: str):
 
     # Check if it's this player's turn
     if game.get_current_player_id() != player_id:
-        await session_manager.send_to_player(
-            room_code, player_id, {"type": "error", "message": "Not your turn"}
-        )
+        await session_manager.send_to_player(room_code, player_id, _ERR_NOT_YOUR_TURN)
         return
 
     # Check phase
     if game.phase != GamePhase.PLAYING:
         await session_manager.send_to_player(
-            room_code, player_id, {"type": "error", "message": "Not in playing phase"}
+            room_code, player_id, _ERR_NOT_PLAYING_PHASE
         )
         return
 
@@ -713,9 +734,7 @@ async def handle_place_tile(room_code: str, player_id: str, tile_str: str):
     try:
         tile = Tile.from_string(tile_str)
     except (ValueError, IndexError):
-        await session_manager.send_to_player(
-            room_code, player_id, {"type": "error", "message": "Invalid tile"}
-        )
+        await session_manager.send_to_player(room_code, player_id, _ERR_INVALID_TILE)
         return
 
     player = game.get_player(player_id)
@@ -756,10 +775,7 @@ async def handle_place_tile(room_code: str, player_id: str, tile_str: str):
         await session_manager.send_to_player(
             room_code,
             player_id,
-            {
-                "type": "error",
-                "message": "Your tiles were replaced. Please select a new tile to play.",
-            },
+            _ERR_TILES_REPLACED,
         )
         return
 
@@ -799,7 +815,9 @@ async def handle_place_tile(room_code: str, player_id: str, tile_str: str):
 
     elif result.next_action == "stock_disposition":
         # Someone needs to handle stock disposition during merger
-        await notify_or_handle_stock_disposition(room_code)
+        state_sent = await notify_or_handle_stock_disposition(room_code)
+        if state_sent:
+            return  # Bot dispositions already broadcast the latest state
 
     await broadcast_game_state(room_code)
 
@@ -848,16 +866,16 @@ async def handle_merger_choice(room_code: str, player_id: str, surviving_chain:
     # Check if stock disposition is needed
     if result.get("next_action") == "stock_disposition":
         pending = game.pending_action
-        if pending and pending.get("type") == "stock_disposition":
+        if isinstance(pending, StockDispositionAction):
             await session_manager.send_to_player(
                 room_code,
-                pending.get("player_id"),
+                pending.player_id,
                 {
                     "type": "stock_disposition_required",
-                    "defunct_chain": pending.get("defunct_chain"),
-                    "surviving_chain": pending.get("surviving_chain"),
-                    "stock_count": pending.get("stock_count"),
-                    "available_to_trade": pending.get("available_to_trade"),
+                    "defunct_chain": pending.defunct_chain,
+                    "surviving_chain": pending.surviving_chain,
+                    "stock_count": pending.stock_count,
+                    "available_to_trade": pending.available_to_trade,
                 },
             )
 
@@ -892,10 +910,12 @@ async def handle_merger_disposition(
         return
 
     # Check if another player needs to handle stock disposition
+    state_sent = False
     if result.get("next_action") == "stock_disposition":
-        await notify_or_handle_stock_disposition(room_code)
+        state_sent = await notify_or_handle_stock_disposition(room_code)
 
-    await broadcast_game_state(room_code)
+    if not state_sent:
+        await broadcast_game_state(room_code)
 
     # Resume bot turn processing after disposition is handled.
     # When a bot triggered the merger and a human had to dispose their stock,
@@ -960,7 +980,7 @@ async def handle_end_turn(room_code: str, player_id: str):
         await session_manager.send_to_player(
             room_code,
             player_id,
-            {"type": "can_end_game", "message": "You may choose to end the game"},
+            _MSG_CAN_END_GAME,
         )
 
     await broadcast_game_state(room_code)
@@ -1089,9 +1109,7 @@ async def handle_accept_trade(room_code: str, player_id: str, trade_id: str):
     # Get trade info before accepting (for notifications)
     trade = game.pending_trades.get(trade_id)
     if trade is None:
-        await session_manager.send_to_player(
-            room_code, player_id, {"type": "error", "message": "Trade not found"}
-        )
+        await session_manager.send_to_player(room_code, player_id, _ERR_TRADE_NOT_FOUND)
         return
 
     from_player_id = trade.from_player_id
@@ -1133,9 +1151,7 @@ async def handle_reject_trade(room_code: str, player_id: str, trade_id: str):
     # Get trade info before rejecting (for notifications)
     trade = game.pending_trades.get(trade_id)
     if trade is None:
-        await session_manager.send_to_player(
-            room_code, player_id, {"type": "error", "message": "Trade not found"}
-        )
+        await session_manager.send_to_player(room_code, player_id, _ERR_TRADE_NOT_FOUND)
         return
 
     from_player_id = trade.from_player_id
@@ -1173,9 +1189,7 @@ async def handle_cancel_trade(room_code: str, player_id: str, trade_id: str):
     # Get trade info before canceling (for notifications)
     trade = game.pending_trades.get(trade_id)
     if trade is None:
-        await session_manager.send_to_player(
-            room_code, player_id, {"type": "error", "message": "Trade not found"}
-        )
+        await session_manager.send_to_player(room_code, player_id, _ERR_TRADE_NOT_FOUND)
         return
 
     from_player_id = trade.from_player_id
@@ -1238,38 +1252,41 @@ async def end_game(room_code: str):
     )
 
 
-async def notify_or_handle_stock_disposition(room_code: str):
+async def notify_or_handle_stock_disposition(room_code: str) -> bool:
     """Handle stock disposition for the pending player (bot or human).
 
     If the player is a bot, automatically generates and submits their disposition.
     If the player is human, sends them the disposition_required message.
     Continues processing until we reach a human or no more dispositions needed.
-    """
-    import asyncio
 
+    Returns:
+        True if the current game state has already been broadcast (a bot
+        disposed last), so callers can skip their own broadcast
+    """
     room = session_manager.get_room(room_code)
     if room is None or room.game is None:
-        return
+        return False
 
     game = room.game
 
     # Safety counter to prevent infinite loops
     max_iterations = 50
     iterations = 0
+    state_sent = False
 
     while iterations < max_iterations:
         iterations += 1
 
         # Check if there's a pending stock disposition
         pending = game.pending_action
-        if not pending or pending.get("type") != "stock_disposition":
+        if not isinstance(pending, StockDispositionAction):
             break
 
-        disposition_player_id = pending.get("player_id")
+        disposition_player_id = pending.player_id
         if not disposition_player_id:
             break
 
-        defunct_chain = pending.get("defunct_chain")
+        defunct_chain = pending.defunct_chain
 
         # Check if this player is a bot
         player_conn = room.players.get(disposition_player_id)
@@ -1281,9 +1298,9 @@ async def notify_or_handle_stock_disposition(room_code: str):
                 {
                     "type": "stock_disposition_required",
                     "defunct_chain": defunct_chain,
-                    "surviving_chain": pending.get("surviving_chain"),
-                    "stock_count": pending.get("stock_count"),
-                    "available_to_trade": pending.get("available_to_trade"),
+                    "surviving_chain": pending.surviving_chain,
+                    "stock_count": pending.stock_count,
+                    "available_to_trade": pending.available_to_trade,
                 },
             )
             break
@@ -1293,8 +1310,8 @@ async def notify_or_handle_stock_disposition(room_code: str):
         if bot is None:
             break
 
-        surviving_chain = pending.get("surviving_chain")
-        stock_count = pending.get("stock_count")
+        surviving_chain = pending.surviving_chain
+        stock_count = pending.stock_count
 
         # Get bot's disposition decision
         decision = bot.choose_stock_disposition(
@@ -1311,6 +1328,7 @@ async def notify_or_handle_stock_disposition(room_code: str):
 
         # Broadcast state after bot's disposition
         await broadcast_game_state(room_code)
+        state_sent = True
 
         # Small delay to prevent overwhelming clients
         await asyncio.sleep(0.1)
@@ -1321,14 +1339,14 @@ async def notify_or_handle_stock_disposition(room_code: str):
 
         # Loop continues to check if another player needs to dispose
 
+    return state_sent
+
 
 async def process_bot_turns(room_code: str):
     """Process bot turns automatically using Game.execute_bot_turn().
 
     This function handles bot players by using the Game class's bot execution.
     """
-    import asyncio
-
     room = session_manager.get_room(room_code)
     if room is None or room.game is None:
         return
@@ -1370,8 +1388,8 @@ async def process_bot_turns(room_code: str):
         # Check if a merger during the bot's turn requires human stock disposition
         if game.phase == GamePhase.MERGING:
             pending = game.pending_action
-            if pending and pending.get("type") == "stock_disposition":
-                disposition_player_id = pending.get("player_id")
+            if isinstance(pending, StockDispositionAction):
+                disposition_player_id = pending.player_id
                 player_conn_disp = room.players.get(disposition_player_id, None)
                 if player_conn_disp and not player_conn_disp.is_bot:
                     # Human needs to handle disposition - notify them and stop
@@ -1441,19 +1459,24 @@ async def broadcast_game_state(room_code: str):
         "tiles_remaining": game_state["tiles_remaining"],
     }
 
+    # Encode the shared part once; every recipient gets the same frame prefix
+    public_text = encode_message(public_state)
+
     # Send to host
-    await session_manager.send_to_host(room_code, public_state)
+    await session_manager.send_text_to_host(room_code, public_text)
 
-    # Send to each player with their private hand info
+    # Send to each player with their private hand info added to the
+    # public frame
     for player_info in game_state["players"]:
         player_id = player_info["player_id"]
         player_state = game.get_player_state(player_id)
-        ws_state = {
-            **public_state,
+        private_state = {
             "your_hand": player_state.get("hand", []),
             "end_game_available": player_state.get("end_game_available", False),
         }
-        await session_manager.send_to_player(room_code, player_id, ws_state)
+        await session_manager.send_text_to_player(
+            room_code, player_id, extend_encoded(public_text, private_state)
+        )
 
 
 async def broadcast_lobby_update(room_code: str):
@@ -1503,19 +1526,18 @@ async def send_player_state(room_code: str, player_id: str):
         if game.phase == GamePhase.MERGING:
             pending = game.pending_action
             if (
-                pending
-                and pending.get("type") == "stock_disposition"
-                and pending.get("player_id") == player_id
+                isinstance(pending, StockDispositionAction)
+                and pending.player_id == player_id
             ):
                 await session_manager.send_to_player(
                     room_code,
                     player_id,
                     {
                         "type": "stock_disposition_required",
-                        "defunct_chain": pending.get("defunct_chain"),
-                        "surviving_chain": pending.get("surviving_chain"),
-                        "stock_count": pending.get("stock_count"),
-                        "available_to_trade": pending.get("available_to_trade"),
+                        "defunct_chain": pending.defunct_chain,
+                        "surviving_chain": pending.surviving_chain,
+                        "stock_count": pending.stock_count,
+                        "available_to_trade": pending.available_to_trade,
                     },
                 )
 
@@ -1526,10 +1548,7 @@ async def send_player_state(room_code: str, player_id: str):
                 await session_manager.send_to_player(
                     room_code,
                     player_id,
-                    {
-                        "type": "can_end_game",
-                        "message": "You may choose to end the game",
-                    },
+                    _MSG_CAN_END_GAME,
                 )
     else:
         await broadcast_lobby_update(room_code)
@@ -1,7 +1,9 @@
 """Session manager for Acquire board game multiplayer rooms."""
 
+import json
 import random
 import string
+import time
 import uuid
 from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING
@@ -12,6 +14,42 @@ if TYPE_CHECKING:
     from game.game import Game
 
 
+_ENCODER = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, check_circular=False
+)
+
+
+def encode_message(message: dict) -> str:
+    """Encode a message the same way WebSocket.send_json() does.
+
+    Encoding once and sending the text lets one message go to several
+    sockets without re-serializing it for each. Messages are plain trees
+    of dicts and lists, so the encoder's circular-reference check is
+    skipped.
+    """
+    return _ENCODER.encode(message)
+
+
+def extend_encoded(text: str, extra: dict) -> str:
+    """Add the fields of extra to a message encoded by encode_message().
+
+    The result decodes to {**message, **extra}, without encoding message
+    again. Both parts must be non-empty JSON objects.
+
+    Args:
+        text: An encoded, non-empty JSON object
+        extra: Non-empty dict of fields to append
+
+    Returns:
+        The encoded, extended message
+    """
+    if not extra:
+        raise ValueError("extra must not be empty")
+    if not (text.startswith("{") and text.endswith("}") and text != "{}"):
+        raise ValueError("text must be a non-empty encoded JSON object")
+    return f"{text[:-1]},{encode_message(extra)[1:]}"
+
+
 @dataclass
 class PlayerConnection:
     """Tracks a connected player."""
@@ -34,6 +72,8 @@ class GameRoom:
     started: bool = False
     max_players: int = 6
     min_players: int = 2
+    # time.monotonic() of the last join or (dis)connect, for stale sweeps
+    last_activity: float = field(default_factory=time.monotonic)
 
 
 class SessionManager:
@@ -91,6 +131,7 @@ class SessionManager:
             name=name,
             is_host=is_host,
         )
+        room.last_activity = time.monotonic()
         return True
 
     def leave_room(self, room_code: str, player_id: str):
@@ -142,6 +183,7 @@ class SessionManager:
         if player_id not in room.players:
             return
         room.players[player_id].websockets.append(websocket)
+        room.last_activity = time.monotonic()
 
     def connect_host(self, room_code: str, websocket: WebSocket):
         """Connect host display."""
@@ -149,6 +191,16 @@ class SessionManager:
         if room is None:
             return
         room.host_websocket = websocket
+        room.last_activity = time.monotonic()
+
+    def disconnect_host(self, room_code: str, websocket: WebSocket):
+        """Handle host display disconnect (ignored if a newer host connected)."""
+        room = self.get_room(room_code)
+        if room is None:
+            return
+        if room.host_websocket is websocket:
+            room.host_websocket = None
+            room.last_activity = time.monotonic()
 
     def disconnect(self, room_code: str, player_id: str, websocket: WebSocket):
         """Handle disconnect for a specific websocket."""
@@ -160,20 +212,19 @@ class SessionManager:
         player = room.players[player_id]
         if websocket in player.websockets:
             player.websockets.remove(websocket)
+        room.last_activity = time.monotonic()
 
-    async def _send_to_websockets(
-        self, player: PlayerConnection, message: dict
-    ) -> None:
+    async def _send_to_websockets(self, player: PlayerConnection, text: str) -> None:
         """Send message to all websockets for a player, removing dead connections.
 
         Args:
             player: The player connection to send to
-            message: The message dict to send
+            text: The message, already encoded with encode_message()
         """
         dead_websockets = []
         for ws in player.websockets:
             try:
-                await ws.send_json(message)
+                await ws.send_text(text)
             except Exception:
                 dead_websockets.append(ws)
         for ws in dead_websockets:
@@ -188,29 +239,38 @@ class SessionManager:
         if room is None:
             return
 
+        text = encode_message(message)
         for player in room.players.values():
             if player.is_bot:
                 continue
-            await self._send_to_websockets(player, message)
+            await self._send_to_websockets(player, text)
 
     async def send_to_player(self, room_code: str, player_id: str, message: dict):
         """Send private message to specific player (all their connections)."""
+        await self.send_text_to_player(room_code, player_id, encode_message(message))
+
+    async def send_text_to_player(self, room_code: str, player_id: str, text: str):
+        """Send a message already encoded with encode_message() to a player."""
         room = self.get_room(room_code)
         if room is None:
             return
         if player_id not in room.players:
             return
 
-        await self._send_to_websockets(room.players[player_id], message)
+        await self._send_to_websockets(room.players[player_id], text)
 
     async def send_to_host(self, room_code: str, message: dict):
         """Send message to host display."""
+        await self.send_text_to_host(room_code, encode_message(message))
+
+    async def send_text_to_host(self, room_code: str, text: str):
+        """Send a message already encoded with encode_message() to the host."""
         room = self.get_room(room_code)
         if room is None:
             return
         if room.host_websocket is not None:
             try:
-                await room.host_websocket.send_json(message)
+                await room.host_websocket.send_text(text)
             except Exception:
                 # Handle disconnected websocket
                 room.host_websocket = None
@@ -229,7 +289,36 @@ class SessionManager:
         # Game initialization will be added when Game class is implemented
         return True
 
+    def sweep_stale_rooms(
+        self, max_idle: float, now: Optional[float] = None
+    ) -> list[str]:
+        """Delete lobby rooms nobody has been connected to for max_idle seconds.
+
+        Rooms with a game are left alone. A room is stale when it has no
+        host display, no open player connections, and no activity within
+        max_idle seconds.
+
+        Args:
+            max_idle: Seconds of inactivity before an unattended room is dropped
+            now: time.monotonic() reading to compare against (defaults to now)
+
+        Returns:
+            Codes of the rooms that were deleted
+        """
+        if now is None:
+            now = time.monotonic()
+        stale = [
+            code
+            for code, room in self._rooms.items()
+            if room.game is None
+            and room.host_websocket is None
+            and now - room.last_activity > max_idle
+            and not any(p.websockets for p in room.players.values())
+        ]
+        for code in stale:
+            self.delete_room(code)
+        return stale
+
     def delete_room(self, room_code: str):
         """Delete a room."""
-        if room_code in self._rooms:
-            del self._rooms[room_code]
+        self._rooms.pop(room_code, None)
@@ -308,6 +308,12 @@ class TestPlayerToPlayerTrading:
         assert result["success"] is False
         assert "maximum" in result.get("error", "").lower()
 
+        # Cancelling one frees a slot for a new proposal
+        pending_id = next(iter(game.pending_trades))
+        assert game.cancel_trade(player_a.player_id, pending_id)["success"] is True
+        result = game.propose_trade(trade)
+        assert result["success"] is True
+
 
 class TestMerger2to1Trades:
     """Tests for merger 2:1 stock trades (Scenarios 2.11 - 2.18)."""
@@ -64,6 +64,17 @@ class TestTile:
         tile_set = {t1, t2}
         assert len(tile_set) == 1
 
+    def test_unchecked_tile_matches_validated(self):
+        tile = Tile._unchecked(5, "C")
+        assert tile == Tile(5, "C")
+        assert hash(tile) == hash(Tile(5, "C"))
+        assert str(tile) == "5C"
+
+    def test_tile_is_immutable(self):
+        tile = Tile(1, "A")
+        with pytest.raises(AttributeError):
+            tile.column = 2
+
 
 class TestBoard:
     """Tests for Board class."""
@@ -71,11 +82,13 @@ class TestBoard:
     def test_board_creation(self):
         board = Board()
         # Should have 12*9 = 108 cells
-        assert len(board._grid) == 108
+        assert len(board._state) == 108
+        assert len(board._chain) == 108
 
     def test_all_cells_empty_initially(self):
         board = Board()
-        for cell in board._grid.values():
+        for tile in Board.all_tiles():
+            cell = board.get_cell(tile.column, tile.row)
             assert cell.state == TileState.EMPTY
             assert cell.chain is None
 
@@ -164,6 +177,39 @@ class TestBoard:
         chains = board.get_adjacent_chains(Tile(2, "A"))
         assert chains == ["Luxor", "Tower"]  # sorted alphabetically
 
+    def test_get_adjacency_tracks_board_changes(self):
+        board = Board()
+        tile = Tile(2, "A")
+        assert board.get_adjacency(tile) == ([], 0)
+
+        board.place_tile(Tile(1, "A"))
+        assert board.get_adjacency(tile) == ([], 1)
+
+        board.set_chain(Tile(1, "A"), "Luxor")
+        board.place_tile(Tile(3, "A"))
+        board.set_chain(Tile(3, "A"), "Tower")
+        assert board.get_adjacency(tile) == (["Luxor", "Tower"], 2)
+
+        board.merge_chains("Tower", "Luxor")
+        assert board.get_adjacency(tile) == (["Tower"], 2)
+
+    def test_would_merge_safe_chains(self):
+        board = Board()
+        # Two 3-tile chains in column 1 (A-C) and column 3 (A-C)
+        for row in "ABC":
+            for col, chain in ((1, "Luxor"), (3, "Tower")):
+                board.place_tile(Tile(col, row))
+                board.set_chain(Tile(col, row), chain)
+
+        # Column 2 sits between them, but only counts once both are safe
+        assert not board.would_merge_safe_chains(Tile(2, "B"), 4)
+        assert board.would_merge_safe_chains(Tile(2, "B"), 3)
+        assert not board.would_merge_safe_chains(Tile(1, "D"), 3)
+
+        board.place_tile(Tile(2, "B"))
+        assert not board.would_merge_safe_chains(Tile(2, "B"), 3)
+        assert board.would_merge_safe_chains(Tile(2, "A"), 3)
+
     def test_get_chain_tiles(self):
         board = Board()
         tiles = [Tile(1, "A"), Tile(2, "A"), Tile(3, "A")]
@@ -183,6 +229,19 @@ class TestBoard:
 
         assert board.get_chain_size("Tower") == 5
 
+    def test_get_chain_sizes(self):
+        board = Board()
+        for i in range(1, 6):
+            tile = Tile(i, "A")
+            board.place_tile(tile)
+            board.set_chain(tile, "Tower")
+        for row in "CD":
+            tile = Tile(1, row)
+            board.place_tile(tile)
+            board.set_chain(tile, "Luxor")
+
+        assert board.get_chain_sizes() == {"Tower": 5, "Luxor": 2}
+
     def test_get_connected_tiles(self):
         board = Board()
         # Create L-shaped group
@@ -202,6 +261,24 @@ class TestBoard:
         connected = board.get_connected_tiles(Tile(1, "A"))
         assert len(connected) == 1
 
+    def test_get_connected_tiles_does_not_wrap_columns(self):
+        board = Board()
+        # 1I and 2A are consecutive in storage but not adjacent on the board
+        board.place_tile(Tile(1, "I"))
+        board.place_tile(Tile(2, "A"))
+
+        assert board.get_connected_tiles(Tile(1, "I")) == {Tile(1, "I")}
+        assert board.get_connected_tiles(Tile(2, "A")) == {Tile(2, "A")}
+
+    def test_get_connected_tiles_winding_path(self):
+        board = Board()
+        path = [Tile(1, "A"), Tile(1, "B"), Tile(2, "B"), Tile(3, "B"), Tile(3, "A")]
+        for t in path:
+            board.place_tile(t)
+        board.place_tile(Tile(5, "A"))
+
+        assert board.get_connected_tiles(Tile(3, "A")) == set(path)
+
     def test_merge_chains(self):
         board = Board()
         # Create two chains
@@ -219,6 +296,43 @@ class TestBoard:
 
         assert board.get_chain_size("Luxor") == 4
         assert board.get_chain_size("Tower") == 0
+        assert board.get_all_chains() == {"Luxor"}
+        assert board.get_cell(4, "A").chain == "Luxor"
+
+    def test_assign_chain_to_connected_unassigned(self):
+        board = Board()
+        for t in [Tile(1, "A"), Tile(2, "A"), Tile(3, "A"), Tile(3, "B")]:
+            board.place_tile(t)
+        board.set_chain(Tile(1, "A"), "Tower")
+        board.place_tile(Tile(6, "A"))  # Not connected
+
+        board.assign_chain_to_connected_unassigned(Tile(3, "A"), "Luxor")
+
+        assert board.get_cell(1, "A").chain == "Tower"
+        assert board.get_chain_size("Luxor") == 3
+        assert board.get_cell(3, "B").state == TileState.IN_CHAIN
+        assert board.get_cell(6, "A").chain is None
+
+    def test_assign_chain_with_nothing_unassigned(self):
+        board = Board()
+        board.place_tile(Tile(1, "A"))
+        board.set_chain(Tile(1, "A"), "Tower")
+
+        board.assign_chain_to_connected_unassigned(Tile(1, "A"), "Luxor")
+        board.assign_chain_to_connected_unassigned(Tile(5, "E"), "Luxor")
+
+        assert board.get_all_chains() == {"Tower"}
+
+    def test_set_chain_reassigns_tile(self):
+        board = Board()
+        tile = Tile(1, "A")
+        board.place_tile(tile)
+        board.set_chain(tile, "Luxor")
+        board.set_chain(tile, "Tower")
+
+        assert board.get_chain_size("Luxor") == 0
+        assert board.get_chain_size("Tower") == 1
+        assert board.get_all_chains() == {"Tower"}
 
     def test_get_all_chains(self):
         board = Board()
@@ -248,10 +362,30 @@ class TestBoard:
         state = board.get_state()
         assert "1A" in state["cells"]
         assert state["cells"]["1A"]["chain"] == "Luxor"
+        assert len(state["cells"]) == 1
+
+    def test_get_state_arrays(self):
+        board = Board()
+        board.place_tile(Tile(1, "B"))
+        board.place_tile(Tile(2, "A"))
+        board.set_chain(Tile(2, "A"), "Tower")
+
+        states, chains = board.get_state_arrays()
+        assert len(states) == 108
+        assert states[1] == TileState.PLAYED  # 1B
+        assert states[9] == TileState.IN_CHAIN  # 2A
+        assert chains[9] == "Tower"
+        assert states[0] == TileState.EMPTY
 
     def test_all_tiles(self):
         tiles = Board.all_tiles()
         assert len(tiles) == 108
+        assert len(set(tiles)) == 108
+
+    def test_all_tiles_returns_independent_lists(self):
+        tiles = Board.all_tiles()
+        tiles.pop()
+        assert len(Board.all_tiles()) == 108
 
 
 class TestBoardCell:
@@ -7,7 +7,7 @@ import pytest
 from game.board import Board, Tile
 from game.hotel import Hotel
 from game.player import Player
-from game.bot import Bot
+from game.bot import Bot, _run_rollout, _score_tile_features
 
 
 class TestBotInit:
@@ -77,6 +77,26 @@ class TestChooseTileToPlay:
         result = bot.choose_tile_to_play(board, hotel)
         assert result == founding_tile
 
+    def test_skips_pending_tiles(self):
+        """Test tiles claimed by another in-flight search are skipped."""
+        player = Player("bot1", "Bot Player")
+        bot = Bot(player, difficulty="hard")
+        board = Board()
+        hotel = Hotel()
+
+        founding_tile = Tile(1, "B")
+        other_tile = Tile(5, "E")
+        player.add_tile(founding_tile)
+        player.add_tile(other_tile)
+        board.place_tile(Tile(1, "A"))
+
+        result = bot.choose_tile_to_play(board, hotel, pending_tiles={founding_tile})
+        assert result == other_tile
+        assert (
+            bot.choose_tile_to_play(board, hotel, pending_tiles=set(player.hand))
+            is None
+        )
+
     def test_prefers_expanding_owned_chains(self):
         """Test bot prefers tiles that expand chains it owns stock in."""
         player = Player("bot1", "Bot Player")
@@ -163,6 +183,24 @@ class TestChooseTileToPlay:
         )
 
 
+class TestScoreTileFeatures:
+    """Tests for the pure tile-scoring function."""
+
+    def test_founding_requires_inactive_chain(self):
+        assert _score_tile_features(1, 0, 0, 0, has_inactive=True) == 100
+        assert _score_tile_features(1, 0, 0, 0, has_inactive=False) == 0
+
+    def test_expanding_owned_chain(self):
+        assert _score_tile_features(1, 1, 4, 0, has_inactive=True) == 70
+        assert _score_tile_features(1, 1, 0, 0, has_inactive=True) == 0
+
+    def test_merger_scores_survivor_and_defunct_stock(self):
+        assert _score_tile_features(2, 2, 2, 3, has_inactive=True) == 36 + 26
+
+    def test_lone_tile_scores_zero(self):
+        assert _score_tile_features(0, 0, 0, 0, has_inactive=True) == 0
+
+
 class TestChooseChainToFound:
     """Tests for chain founding preferences."""
 
@@ -415,6 +453,25 @@ class TestChooseStocksToBuy:
         result = bot.choose_stocks_to_buy(board, hotel)
         assert result == []
 
+    def test_pending_purchases_reduce_availability(self):
+        """Test shares claimed elsewhere count as unavailable."""
+        player = Player("bot1", "Bot Player")
+        bot = Bot(player, difficulty="hard")
+        board = Board()
+        hotel = Hotel()
+
+        for col in range(1, 4):
+            tile = Tile(col, "A")
+            board.place_tile(tile)
+            board.set_chain(tile, "Luxor")
+        hotel.activate_chain("Luxor")
+
+        available = hotel.get_available_stocks("Luxor")
+        result = bot.choose_stocks_to_buy(
+            board, hotel, pending_purchases={"Luxor": available}
+        )
+        assert result == []
+
     def test_respects_max_stocks_limit(self):
         """Test doesn't buy more than max_stocks."""
         player = Player("bot1", "Bot Player")
@@ -650,3 +707,16 @@ class TestIntegration:
         assert "trade" in disposition
         assert "keep" in disposition
         assert disposition["sell"] + disposition["trade"] + disposition["keep"] == 3
+
+    def test_simulate_games_matches_serial_rollouts(self):
+        """Parallel rollouts are deterministic per seed."""
+        difficulties = ["easy", "medium", "hard"]
+        results = Bot.simulate_games([1, 2], difficulties, max_turns=60, workers=2)
+
+        assert len(results) == 2
+        assert results[0] == _run_rollout((1, tuple(difficulties), 60))
+        for standings in results:
+            assert len(standings) == 3
+            assert [s["rank"] for s in standings] == sorted(
+                s["rank"] for s in standings
+            )
@@ -1,7 +1,12 @@
 """Tests for the main Game class."""
 
 import pytest
-from game.game import Game, GamePhase
+from game.game import (
+    Game,
+    GamePhase,
+    FoundChainAction,
+    StockDispositionAction,
+)
 from game.board import Tile, Board
 from game.hotel import Hotel
 from game.player import Player
@@ -210,6 +215,29 @@ class TestTurnFlow:
         current = game.get_current_player()
         assert current.player_id == "p2"
 
+    def test_setting_turn_index_updates_current_player(self):
+        """Assigning the turn index directly should move the current player."""
+        game = Game()
+        game.add_player("p1", "Alice")
+        game.add_player("p2", "Bob")
+        game.add_player("p3", "Charlie")
+        game.start_game()
+
+        game.current_turn_index = 2
+        assert game.get_current_player().player_id == "p3"
+        assert game.get_current_player_id() == "p3"
+        assert game.can_player_act("p3")
+        assert not game.can_player_act("p1")
+
+    def test_current_player_none_without_players(self):
+        """An empty lobby has no current player."""
+        game = Game()
+        assert game.get_current_player_id() is None
+        game.add_player("p1", "Alice")
+        assert game.get_current_player_id() == "p1"
+        game.remove_player("p1")
+        assert game.get_current_player_id() is None
+
     def test_turn_wraps_around(self):
         """Test that turns wrap around to first player."""
         game = Game()
@@ -411,6 +439,39 @@ class TestChainFounding:
         assert "available_chains" in result
         assert len(result["available_chains"]) == 7
 
+        assert result.tile == adjacent_tile
+        assert result.to_dict()["tile"] == "5F"
+
+        pending = game.pending_action
+        assert isinstance(pending, FoundChainAction)
+        assert pending.tile == adjacent_tile
+        assert pending.get("type") == "found_chain"
+        assert game.get_public_state()["pending_action"]["tile"] == "5F"
+
+    def test_pending_action_dict_is_converted(self):
+        """Assigning a dict should yield the matching typed action."""
+        game = Game()
+        game.pending_action = {
+            "type": "stock_disposition",
+            "player_id": "p1",
+            "defunct_chain": "Tower",
+            "surviving_chain": "American",
+            "stock_count": 4,
+            "unknown_key": True,
+        }
+
+        pending = game.pending_action
+        assert isinstance(pending, StockDispositionAction)
+        assert pending.stock_count == 4
+        assert pending["defunct_chain"] == "Tower"
+        assert pending.available_to_trade == 0
+
+    def test_pending_action_unknown_type_rejected(self):
+        """An unrecognized action type should raise ValueError."""
+        game = Game()
+        with pytest.raises(ValueError):
+            game.pending_action = {"type": "process_merger"}
+
     def test_found_chain(self):
         """Test founding a chain after playing a founding tile."""
         game = Game()
@@ -915,6 +976,43 @@ class TestBotExecution:
 class TestGameState:
     """Tests for game state retrieval."""
 
+    def _bot_game(self, seed):
+        game = Game(seed=seed)
+        for i in range(3):
+            game.add_player(f"b{i}", f"Bot {i}", is_bot=True, bot_difficulty="hard")
+        game.start_game()
+        return game
+
+    def _play(self, game, turns):
+        for _ in range(turns):
+            game.execute_bot_turn(game.get_current_player_id())
+
+    def test_snapshot_restore_replays_identically(self):
+        """Restoring a snapshot should rewind every piece of game state."""
+        game = self._bot_game(seed=7)
+        self._play(game, 10)
+
+        snap = game.snapshot()
+        self._play(game, 20)
+        first = game.get_public_state()
+
+        game.restore(snap)
+        self._play(game, 20)
+        assert game.get_public_state() == first
+
+        # The snapshot is reusable
+        game.restore(snap)
+        self._play(game, 20)
+        assert game.get_public_state() == first
+
+    def test_restore_rejects_other_players(self):
+        """A snapshot only applies to the game's own players."""
+        snap = self._bot_game(seed=1).snapshot()
+        other = Game()
+        other.add_player("x", "X")
+        with pytest.raises(ValueError):
+            other.restore(snap)
+
     def test_get_public_state(self):
         """Test getting public game state."""
         game = Game()
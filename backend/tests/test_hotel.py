@@ -1,5 +1,6 @@
 """Tests for hotel.py - Hotel chain logic."""
 
+from game.board import Board, Tile
 from game.hotel import Hotel, HotelChain, HotelTier
 
 
@@ -91,6 +92,15 @@ class TestHotel:
         assert "Luxor" in names
         assert "Continental" in names
 
+    def test_intern_chain_name(self):
+        # Decode at runtime so the string is not the interned "Luxor"
+        # literal the compiler would share with Hotel.CHAINS
+        name = str(bytearray(b"Luxor"), "ascii")
+        canonical = Hotel.intern_chain_name(name)
+        assert canonical == "Luxor"
+        assert canonical is next(n for n in Hotel.CHAINS if n == "Luxor")
+        assert Hotel.intern_chain_name("Nope") == "Nope"
+
     def test_initial_available_stocks(self):
         hotel = Hotel()
         assert hotel.get_available_stocks("Luxor") == 25
@@ -122,6 +132,17 @@ class TestHotel:
         assert "Luxor" not in inactive
         assert len(inactive) == 6
 
+    def test_snapshot_active(self):
+        hotel = Hotel()
+        board = Board()
+        for col in (1, 2, 3):
+            board.place_tile(Tile(col, "A"))
+            board.set_chain(Tile(col, "A"), "Tower")
+        hotel.activate_chain("Tower")
+        hotel.buy_stock("Tower", 4)
+
+        assert hotel.snapshot_active(board) == {"Tower": (21, 3, 300)}
+
     def test_buy_stock_success(self):
         hotel = Hotel()
         result = hotel.buy_stock("Luxor", 3)
@@ -4,18 +4,24 @@ These tests verify individual handler functions in main.py work correctly
 with proper validation and error handling.
 """
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
 from main import (
     session_manager,
+    broadcast_game_state,
     handle_place_tile,
     handle_found_chain,
     handle_buy_stocks,
     handle_end_turn,
     handle_merger_choice,
+    handle_merger_disposition,
     handle_player_action,
     validate_websocket_message,
+    _ACTION_HANDLERS,
+    _MESSAGE_TYPES,
     PlaceTileMessage,
     FoundChainMessage,
     BuyStocksMessage,
@@ -115,6 +121,10 @@ class TestMessageValidation:
         assert error is not None
         assert "Unknown action" in error
 
+    def test_every_validated_action_has_handler(self):
+        """Each action that passes validation is routed to a handler."""
+        assert set(_ACTION_HANDLERS) == set(_MESSAGE_TYPES)
+
 
 class TestHandlePlaceTileValidation:
     """Tests for handle_place_tile validation."""
@@ -529,6 +539,67 @@ class TestHandleMergerChoice:
             assert pending.get("type") != "process_merger"
 
 
+class TestMergerDispositionBroadcast:
+    """Tests for broadcasts after a merger disposition."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("bots_broadcast", [True, False])
+    async def test_broadcasts_once(
+        self, game_room, clean_session_manager, bots_broadcast
+    ):
+        """State is broadcast once, by bots' dispositions or by the handler."""
+        game = clean_session_manager.get_room(game_room).game
+        result = {"success": True, "next_action": "stock_disposition"}
+
+        with (
+            patch.object(game, "handle_stock_disposition", return_value=result),
+            patch(
+                "main.notify_or_handle_stock_disposition",
+                new_callable=AsyncMock,
+                return_value=bots_broadcast,
+            ),
+            patch("main.broadcast_game_state", new_callable=AsyncMock) as broadcast,
+            patch("main.process_bot_turns", new_callable=AsyncMock),
+        ):
+            await handle_merger_disposition(
+                game_room, "player_1", "Luxor", {"sell": 1, "trade": 0, "hold": 0}
+            )
+
+        assert broadcast.await_count == (0 if bots_broadcast else 1)
+
+
+class TestBroadcastGameState:
+    """Tests for the pre-encoded game state frames."""
+
+    @pytest.mark.asyncio
+    async def test_player_frames_extend_host_frame(
+        self, game_room, clean_session_manager
+    ):
+        """Each player frame is the host frame plus that player's private fields."""
+        game = clean_session_manager.get_room(game_room).game
+
+        with (
+            patch.object(
+                session_manager, "send_text_to_host", new_callable=AsyncMock
+            ) as to_host,
+            patch.object(
+                session_manager, "send_text_to_player", new_callable=AsyncMock
+            ) as to_player,
+        ):
+            await broadcast_game_state(game_room)
+
+        host_state = json.loads(to_host.await_args.args[1])
+        assert to_player.await_count == len(game.players)
+        for call in to_player.await_args_list:
+            _, player_id, text = call.args
+            player_state = game.get_player_state(player_id)
+            assert json.loads(text) == {
+                **host_state,
+                "your_hand": player_state["hand"],
+                "end_game_available": player_state.get("end_game_available", False),
+            }
+
+
 class TestActionOnUnstartedGame:
     """Tests for actions on games that haven't started."""
 
@@ -362,6 +362,11 @@ class TestPhaseStateConsistency:
         for name in expected:
             assert hasattr(GamePhase, name), f"Missing GamePhase.{name}"
 
+    def test_phase_labels(self):
+        """Phases expose their lowercase name as a string label."""
+        assert GamePhase.BUYING_STOCKS.label == "buying_stocks"
+        assert GamePhase.TILE_PLAYED.label == "tile_played"
+
     def test_game_starts_in_lobby(self):
         """New game starts in LOBBY phase."""
         game = Game(seed=42)
@@ -31,6 +31,11 @@ class TestPlayerInitialization:
         assert player.player_id == "player_123"
         assert player.name == "Bob"
 
+    def test_player_uses_slots(self):
+        """Player should not carry a per-instance __dict__."""
+        player = Player("p1", "Alice")
+        assert not hasattr(player, "__dict__")
+
 
 class TestTileManagement:
     """Tests for adding and removing tiles from hand."""
@@ -86,6 +91,15 @@ class TestTileManagement:
         tile = Tile(1, "A")
         assert player.remove_tile(tile) is False
 
+    def test_clear_hand(self):
+        """clear_hand empties the hand and returns the tiles in order."""
+        player = Player("p1", "Alice")
+        tiles = [Tile(3, "C"), Tile(1, "A")]
+        for tile in tiles:
+            player.add_tile(tile)
+        assert player.clear_hand() == tiles
+        assert player.hand_size == 0
+
     def test_hand_returns_copy(self):
         """Hand property should return a copy, not the internal list."""
         player = Player("p1", "Alice")
@@ -225,7 +225,7 @@ class TestGetPlacementResult:
 
         assert result.result_type == PlacementResult.NOTHING
         assert result.chain is None
-        assert result.chains == []
+        assert result.chains == ()
 
     def test_found_new_chain(self):
         """Tile adjacent to played tile (no chain) returns 'found'."""
@@ -764,6 +764,26 @@ class TestIsTilePermanentlyUnplayable:
 
         assert Rules.is_tile_permanently_unplayable(board, tile, hotel) is False
 
+    def test_get_permanently_unplayable_filters_hand(self):
+        """get_permanently_unplayable() agrees with the per-tile check."""
+        board = Board()
+        hotel = Hotel()
+
+        for first, chain in [(1, "Luxor"), (5, "Tower")]:
+            cells = [Tile(first, row) for row in "ABCDEFGHI"]
+            cells += [Tile(first + 1, "A"), Tile(first + 2, "A")]
+            for t in cells:
+                board.place_tile(t)
+                board.set_chain(t, chain)
+            hotel.activate_chain(chain)
+
+        hand = [Tile(9, "E"), Tile(4, "A"), Tile(1, "A"), Tile(4, "B")]
+
+        assert Rules.get_permanently_unplayable(board, hand, hotel) == [
+            t for t in hand if Rules.is_tile_permanently_unplayable(board, t, hotel)
+        ]
+        assert Rules.get_permanently_unplayable(board, hand, hotel) == [Tile(4, "A")]
+
 
 class TestGetPlayableTiles:
     """Tests for Rules.get_playable_tiles()"""
@@ -812,6 +832,18 @@ class TestGetPlayableTiles:
         assert len(playable) == 1
         assert playable[0].coords == (10, "E")
 
+    def test_iter_playable_tiles_is_lazy(self):
+        """iter_playable_tiles yields in hand order without building a list."""
+        board = Board()
+        hotel = Hotel()
+        tiles = [Tile(1, "A"), Tile(5, "E"), Tile(12, "I")]
+
+        playable = Rules.iter_playable_tiles(board, tiles, hotel)
+
+        assert not isinstance(playable, list)
+        assert next(playable) == Tile(1, "A")
+        assert list(playable) == [Tile(5, "E"), Tile(12, "I")]
+
 
 class TestGetUnplayableTiles:
     """Tests for Rules.get_unplayable_tiles()"""
@@ -860,6 +892,27 @@ class TestGetUnplayableTiles:
         assert len(unplayable) == 1
         assert unplayable[0].coords == (4, "A")
 
+    def test_founding_tile_unplayable_with_7_chains(self):
+        """With every chain active, tiles that would found an 8th are unplayable."""
+        board = Board()
+        hotel = Hotel()
+        for col, chain_name in enumerate(Hotel.get_all_chain_names(), start=1):
+            for row in "AB":
+                board.place_tile(Tile(col, row))
+                board.set_chain(Tile(col, row), chain_name)
+            hotel.activate_chain(chain_name)
+        board.place_tile(Tile(10, "E"))
+
+        # 11E would found a chain, 12I is isolated, 1C grows Luxor, 5A is taken
+        tiles = [Tile(11, "E"), Tile(12, "I"), Tile(1, "C"), Tile(5, "A")]
+
+        unplayable = Rules.get_unplayable_tiles(board, tiles, hotel)
+
+        assert unplayable == [Tile(11, "E"), Tile(5, "A")]
+        assert unplayable == [
+            t for t in tiles if not Rules.can_place_tile(board, t, hotel)
+        ]
+
 
 class TestPlacementResult:
     """Tests for PlacementResult class."""
@@ -881,6 +934,13 @@ class TestPlacementResult:
         assert "merge" in repr(result)
         assert "Luxor" in repr(result)
 
+    def test_unpacks_as_tuple(self):
+        """PlacementResult is a plain tuple of (result_type, chain, chains)."""
+        result_type, chain, chains = PlacementResult(
+            PlacementResult.EXPAND, chain="Luxor"
+        )
+        assert (result_type, chain, chains) == (PlacementResult.EXPAND, "Luxor", ())
+
 
 class TestRoundUpToHundred:
     """Tests for the internal _round_up_to_hundred method."""
@@ -903,6 +963,48 @@ class TestRoundUpToHundred:
         """Zero stays zero."""
         assert Rules._round_up_to_hundred(0) == 0
 
+    def test_split_bonus_matches_float_rounding(self):
+        """Integer split agrees with rounding the float quotient."""
+        for total in (0, 1500, 3000, 3500, 4500, 6000, 7500, 10500):
+            for holders in range(1, 7):
+                assert Rules._split_bonus(total, holders) == (
+                    Rules._round_up_to_hundred(total / holders)
+                )
+
+
+class TestValidDispositionCombinations:
+    """Tests for Rules.get_valid_disposition_combinations()"""
+
+    def test_small_holding(self):
+        """Every sell/even-trade/keep split of 3 shares is listed."""
+        combos = Rules.get_valid_disposition_combinations(3)
+        assert set(combos) == {
+            (0, 0, 3),
+            (0, 2, 1),
+            (1, 0, 2),
+            (1, 2, 0),
+            (2, 0, 1),
+            (3, 0, 0),
+        }
+
+    def test_trade_limited_by_survivor_stock(self):
+        """Trades cannot exceed twice the available survivor shares."""
+        combos = Rules.get_valid_disposition_combinations(10, available_to_trade=1)
+        assert max(trade for _, trade, _ in combos) == 2
+        assert all(sum(c) == 10 for c in combos)
+
+    def test_results_are_cached(self):
+        """Repeated calls share one immutable result."""
+        first = Rules.get_valid_disposition_combinations(8, 3)
+        assert first is Rules.get_valid_disposition_combinations(8, 3)
+        assert isinstance(first, tuple)
+
+    def test_unconstrained_availability_shares_result(self):
+        """Availability beyond half the holding gives the same table entry."""
+        combos = Rules.get_valid_disposition_combinations(7, 4)
+        assert combos is Rules.get_valid_disposition_combinations(7, 25)
+        assert max(trade for _, trade, _ in combos) == 6
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
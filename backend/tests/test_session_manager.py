@@ -3,10 +3,12 @@
 Tests for room lifecycle, player management, and connection handling.
 """
 
+import json
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 
-from session.manager import SessionManager
+from session.manager import SessionManager, encode_message, extend_encoded
 
 
 class TestRoomCreation:
@@ -311,6 +313,22 @@ class TestConnectionManagement:
         room = manager.get_room(code)
         assert room.host_websocket == ws
 
+    def test_disconnect_host_clears_only_current_socket(self):
+        """A stale host disconnect doesn't clear a newer host connection."""
+        manager = SessionManager()
+        code = manager.create_room()
+
+        old_ws = MagicMock()
+        new_ws = MagicMock()
+        manager.connect_host(code, old_ws)
+        manager.connect_host(code, new_ws)
+
+        manager.disconnect_host(code, old_ws)
+        assert manager.get_room(code).host_websocket is new_ws
+
+        manager.disconnect_host(code, new_ws)
+        assert manager.get_room(code).host_websocket is None
+
 
 class TestGameStart:
     """Tests for game start functionality."""
@@ -379,6 +397,31 @@ class TestRoomDeletion:
 
         manager.delete_room("XXXX")  # Should not raise
 
+    def test_sweep_removes_idle_unattended_room(self):
+        """Rooms nobody is connected to are swept once idle long enough."""
+        manager = SessionManager()
+        code = manager.create_room()
+        manager.join_room(code, "player_1", "Alice")
+        idle_from = manager.get_room(code).last_activity
+
+        assert manager.sweep_stale_rooms(60, now=idle_from + 30) == []
+        assert manager.sweep_stale_rooms(60, now=idle_from + 61) == [code]
+        assert manager.get_room(code) is None
+
+    def test_sweep_keeps_connected_and_started_rooms(self):
+        """Rooms with a connection or a game survive the sweep."""
+        manager = SessionManager()
+        connected = manager.create_room()
+        manager.join_room(connected, "player_1", "Alice")
+        manager.connect_player(connected, "player_1", MagicMock())
+        hosted = manager.create_room()
+        manager.connect_host(hosted, MagicMock())
+        playing = manager.create_room()
+        manager.get_room(playing).game = MagicMock()
+
+        later = manager.get_room(hosted).last_activity + 3600
+        assert manager.sweep_stale_rooms(60, now=later) == []
+
 
 class TestBroadcasting:
     """Tests for message broadcasting."""
@@ -398,8 +441,8 @@ class TestBroadcasting:
 
         await manager.broadcast_to_room(code, {"type": "test"})
 
-        ws1.send_json.assert_called_once_with({"type": "test"})
-        ws2.send_json.assert_called_once_with({"type": "test"})
+        ws1.send_text.assert_called_once_with('{"type":"test"}')
+        ws2.send_text.assert_called_once_with('{"type":"test"}')
 
     @pytest.mark.asyncio
     async def test_send_to_player(self):
@@ -416,8 +459,8 @@ class TestBroadcasting:
 
         await manager.send_to_player(code, "p1", {"type": "private"})
 
-        ws1.send_json.assert_called_once_with({"type": "private"})
-        ws2.send_json.assert_not_called()
+        ws1.send_text.assert_called_once_with('{"type":"private"}')
+        ws2.send_text.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_send_to_host(self):
@@ -430,7 +473,7 @@ class TestBroadcasting:
 
         await manager.send_to_host(code, {"type": "host_message"})
 
-        ws.send_json.assert_called_once_with({"type": "host_message"})
+        ws.send_text.assert_called_once_with('{"type":"host_message"}')
 
     @pytest.mark.asyncio
     async def test_broadcast_skips_bots(self):
@@ -446,7 +489,7 @@ class TestBroadcasting:
         await manager.broadcast_to_room(code, {"type": "test"})
 
         # Only human player receives
-        ws.send_json.assert_called_once()
+        ws.send_text.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_broadcast_handles_dead_connection(self):
@@ -456,10 +499,37 @@ class TestBroadcasting:
         manager.join_room(code, "p1", "Alice")
 
         ws = AsyncMock()
-        ws.send_json.side_effect = Exception("Connection closed")
+        ws.send_text.side_effect = Exception("Connection closed")
         manager.connect_player(code, "p1", ws)
 
         await manager.broadcast_to_room(code, {"type": "test"})
 
         room = manager.get_room(code)
         assert ws not in room.players["p1"].websockets
+
+
+class TestEncoding:
+    """Tests for pre-encoded message helpers."""
+
+    def test_extend_encoded_matches_merged_dict(self):
+        """Extended text decodes to the merged dict."""
+        message = {"type": "game_state", "board": {"1A": None}, "phase": "x"}
+        extra = {"your_hand": ["1A", "2B"], "end_game_available": False}
+
+        text = extend_encoded(encode_message(message), extra)
+
+        assert json.loads(text) == {**message, **extra}
+        assert text == encode_message({**message, **extra})
+
+    @pytest.mark.parametrize(
+        "text,extra",
+        [
+            ("{}", {"a": 1}),
+            ('{"a":1}', {}),
+            ("[1]", {"a": 1}),
+        ],
+    )
+    def test_extend_encoded_rejects_empty_or_non_object(self, text, extra):
+        """Empty or non-object parts would produce invalid JSON."""
+        with pytest.raises(ValueError):
+            extend_encoded(text, extra)